@@ -3,7 +3,6 @@
 from pathlib import Path
 from typing import Annotated
 
-import questionary
 import typer
 import yaml
 
@@ -44,6 +43,8 @@ def _prompt_project_size() -> ProjectTier | None:
     Raises:
         typer.Abort: If user cancels the selection
     """
+    import questionary
+
     answer = questionary.select(
         "What's the project size?",
         choices=[tier.value for tier in ProjectTier] + ["unsure"],
@@ -71,6 +72,8 @@ def _prompt_docs_for_tier(tier: ProjectTier) -> dict[DocTemplateKey, DocTemplate
     Raises:
         typer.Abort: If user cancels the selection
     """
+    import questionary
+
     options = get_scope(tier)
     choices = [
         questionary.Choice(
@@ -109,7 +112,10 @@ def _load_state(state_path: Path) -> ScopeTemplate:
         with state_path.open() as f:
             data = yaml.safe_load(f)
         return ScopeTemplate(**data)
-    except (yaml.YAMLError, TypeError, FileNotFoundError) as e:
+    except FileNotFoundError as e:
+        error(f"State file not found at {state_path}. Please run 'scope create' first.")
+        raise typer.Abort() from e
+    except (yaml.YAMLError, TypeError) as e:
         error(f"Failed to load state from {state_path}: {e}")
         raise typer.Abort() from e
 
@@ -137,7 +143,7 @@ def _determine_project_size(
     interactive: bool,
     project_size_input: str | None,
     service,
-) -> ProjectTier:
+) -> tuple[ProjectTier, str | None]:
     """Determine the project size from input, prompt, or automatic detection.
 
     Args:
@@ -146,9 +152,11 @@ def _determine_project_size(
         service: ScopeService for automatic detection
 
     Returns:
-        Determined ProjectTier
+        Tuple of (determined ProjectTier, code structure if it was computed during
+        automatic detection, otherwise None)
     """
     size_enum = None
+    code_structure = None
 
     # Try to parse from input
     if project_size_input:
@@ -169,7 +177,7 @@ def _determine_project_size(
             progress.add_task(description="Determining project size...", total=None)
             size_enum = service.get_complexity(code_structure, code_metadata)
 
-    return size_enum
+    return size_enum, code_structure
 
 
 def _determine_doc_sections(
@@ -203,10 +211,11 @@ def create(
         state_path: Path = ctx.settings.scope_path
         service = ctx.factory.scope_service(Path("."), ctx.branch, ctx.tracker)
 
-        size_enum = _determine_project_size(interactive, project_size, service)
+        size_enum, code_structure = _determine_project_size(interactive, project_size, service)
         doc_sections = _determine_doc_sections(interactive, size_enum)
 
-        code_structure = service.get_code_overview()
+        if code_structure is None:
+            code_structure = service.get_code_overview()
         doc_files = service.get_doc_overview()
 
         scope_template = ScopeTemplate(
@@ -228,17 +237,13 @@ def apply(
 ):
     """Apply the previously created documentation scope."""
     with command_context(branch=branch) as ctx:
-        state_path: Path = ctx.settings.scope_path
-        if not state_path.is_file():
-            error(f"State file not found at {state_path}. Please run 'scope create' first.")
-            raise typer.Abort()
+        scope_template = _load_state(ctx.settings.scope_path)
 
         if not typer.confirm("Are you sure you want to apply the scoped changes?"):
             console.print("Aborted.")
             return
 
         service = ctx.factory.scope_service(Path("."), ctx.branch, ctx.tracker)
-        scope_template = _load_state(state_path)
 
         try:
             service.apply_scope(scope_template)
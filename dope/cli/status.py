@@ -1,6 +1,7 @@
 """Show current processing status."""
 
 import json
+from pathlib import Path
 
 import typer
 
@@ -17,6 +18,28 @@ Examples:
 )
 
 
+def _load_state_file(path: Path) -> dict:
+    """Load a JSON state file, returning an empty dict if it does not exist.
+
+    Opening directly instead of checking ``exists()`` first saves one stat call per file.
+    """
+    try:
+        with path.open() as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def _count_summarized(state: dict) -> tuple[int, int]:
+    """Count scanned and summarized entries of a describer state in a single pass."""
+    scanned = 0
+    summarized = 0
+    for item in state.values():
+        scanned += 1
+        summarized += bool(item.get("summary"))
+    return scanned, summarized
+
+
 @app.command()
 def status():
     """Show current status of scanned files and suggestions."""
@@ -29,27 +52,11 @@ def status():
     scope_path = settings.scope_path
 
     # Count items in each state
-    docs_scanned = 0
-    docs_summarized = 0
-    if docs_state_path.exists():
-        with docs_state_path.open() as f:
-            docs_state = json.load(f)
-            docs_scanned = len(docs_state)
-            docs_summarized = sum(1 for item in docs_state.values() if item.get("summary"))
-
-    code_scanned = 0
-    code_summarized = 0
-    if code_state_path.exists():
-        with code_state_path.open() as f:
-            code_state = json.load(f)
-            code_scanned = len(code_state)
-            code_summarized = sum(1 for item in code_state.values() if item.get("summary"))
-
-    suggestions_count = 0
-    if suggestions_state_path.exists():
-        with suggestions_state_path.open() as f:
-            suggestions_state = json.load(f)
-            suggestions_count = len(suggestions_state.get("changes_to_apply", []))
+    docs_scanned, docs_summarized = _count_summarized(_load_state_file(docs_state_path))
+    code_scanned, code_summarized = _count_summarized(_load_state_file(code_state_path))
+
+    suggestions_state = _load_state_file(suggestions_state_path)
+    suggestions_count = len(suggestions_state.get("changes_to_apply", []))
 
     scope_exists = scope_path.exists()
 
@@ -4,11 +4,32 @@ import json
 from pathlib import Path
 
 import yaml
+from rich.console import Group
 from rich.table import Table
+from rich.text import Text
 
 from dope.cli.ui.console import console
 from dope.models.settings import Settings
 
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper
+
+_SECRET_FIELDS = {"agent": {"token"}}
+
+
+def _safe_dump(settings: Settings) -> dict:
+    """Serialize settings to JSON-compatible data with secrets removed.
+
+    Args:
+        settings: Application settings to serialize
+
+    Returns:
+        Settings as a plain dictionary without the agent token
+    """
+    return settings.model_dump(mode="json", exclude=_SECRET_FIELDS)
+
 
 class ConfigFormatter:
     """Format and display configuration information."""
@@ -38,7 +59,7 @@ class ConfigFormatter:
         table.add_row("[bold]Docs Settings[/bold]", "")
         table.add_row("  Docs Root", str(settings.docs.docs_root))
         table.add_row("  File Types", ", ".join(sorted(settings.docs.doc_filetypes)))
-        exclude_list = sorted(list(settings.docs.exclude_dirs))
+        exclude_list = sorted(settings.docs.exclude_dirs)
         exclude_display = ", ".join(exclude_list[:5]) + (", ..." if len(exclude_list) > 5 else "")
         table.add_row("  Excluded Dirs", exclude_display)
         table.add_row("", "")
@@ -50,12 +71,11 @@ class ConfigFormatter:
             table.add_row("  Base URL", str(settings.agent.base_url))
         table.add_row("  Token", "[dim]●●●●●●●●[/dim] (hidden)")
 
-        console.print(table)
-
         # Show config file location
         from dope import config_filepath
 
-        console.print(f"\n📄 Config file: [blue]{config_filepath}[/blue]")
+        footer = Text.from_markup(f"\n📄 Config file: [blue]{config_filepath}[/blue]")
+        console.print(Group(table, footer))
 
     @staticmethod
     def display_json(settings: Settings) -> None:
@@ -64,8 +84,7 @@ class ConfigFormatter:
         Args:
             settings: Application settings to display
         """
-        safe_dump = settings.model_dump(mode="json", exclude={"agent": {"token"}})
-        console.print_json(json.dumps(safe_dump, indent=2))
+        console.print_json(json.dumps(_safe_dump(settings), indent=2))
 
     @staticmethod
     def display_yaml(settings: Settings) -> None:
@@ -74,8 +93,7 @@ class ConfigFormatter:
         Args:
             settings: Application settings to display
         """
-        safe_dump = settings.model_dump(mode="json", exclude={"agent": {"token"}})
-        console.print(yaml.dump(safe_dump, sort_keys=False))
+        console.print(yaml.dump(_safe_dump(settings), Dumper=_YamlDumper, sort_keys=False))
 
 
 class StatusFormatter:
@@ -107,51 +125,54 @@ class StatusFormatter:
         table.add_column("Component", style="cyan", no_wrap=True)
         table.add_column("Status", style="green")
 
-        # Documentation status
-        if docs_scanned > 0:
-            table.add_row(
+        rows = [
+            (
                 "Documentation Files",
-                f"{docs_summarized}/{docs_scanned} scanned and summarized",
-            )
-        else:
-            table.add_row("Documentation Files", "[dim]Not scanned yet[/dim]")
-
-        # Code status
-        if code_scanned > 0:
-            table.add_row("Code Files", f"{code_summarized}/{code_scanned} scanned and summarized")
-        else:
-            table.add_row("Code Files", "[dim]Not scanned yet[/dim]")
-
-        # Suggestions status
-        if suggestions_count > 0:
-            table.add_row("Suggestions", f"{suggestions_count} ready to apply")
-        else:
-            table.add_row("Suggestions", "[dim]No suggestions generated[/dim]")
-
-        # Scope status
-        if scope_exists:
-            table.add_row("Documentation Scope", "✓ Configured")
-        else:
-            table.add_row("Documentation Scope", "[dim]Not configured[/dim]")
-
-        console.print(table)
+                f"{docs_summarized}/{docs_scanned} scanned and summarized"
+                if docs_scanned > 0
+                else "[dim]Not scanned yet[/dim]",
+            ),
+            (
+                "Code Files",
+                f"{code_summarized}/{code_scanned} scanned and summarized"
+                if code_scanned > 0
+                else "[dim]Not scanned yet[/dim]",
+            ),
+            (
+                "Suggestions",
+                f"{suggestions_count} ready to apply"
+                if suggestions_count > 0
+                else "[dim]No suggestions generated[/dim]",
+            ),
+            (
+                "Documentation Scope",
+                "✓ Configured" if scope_exists else "[dim]Not configured[/dim]",
+            ),
+        ]
+        for row in rows:
+            table.add_row(*row)
 
         # Show next steps
-        console.print("\n[bold cyan]Next Steps:[/bold cyan]")
+        next_steps = ["\n[bold cyan]Next Steps:[/bold cyan]"]
         if docs_scanned == 0 and code_scanned == 0:
-            console.print("  • Run [blue]dope update[/blue] to scan and update everything")
-            console.print("    or use individual commands:")
+            next_steps.append("  • Run [blue]dope update[/blue] to scan and update everything")
+            next_steps.append("    or use individual commands:")
         if docs_scanned == 0:
-            console.print("  1. Run [blue]dope scan docs[/blue] to scan documentation")
+            next_steps.append("  1. Run [blue]dope scan docs[/blue] to scan documentation")
         if code_scanned == 0:
-            console.print("  2. Run [blue]dope scan code[/blue] to scan code changes")
+            next_steps.append("  2. Run [blue]dope scan code[/blue] to scan code changes")
         if suggestions_count == 0 and (docs_scanned > 0 or code_scanned > 0):
-            console.print("  3. Run [blue]dope suggest[/blue] to generate suggestions")
+            next_steps.append("  3. Run [blue]dope suggest[/blue] to generate suggestions")
         if suggestions_count > 0:
-            console.print("  4. Run [blue]dope apply[/blue] to apply suggestions")
+            next_steps.append("  4. Run [blue]dope apply[/blue] to apply suggestions")
 
         # Show state directory
-        console.print(f"\n📁 State directory: [blue]{state_directory}[/blue]")
+        footer = f"\n📁 State directory: [blue]{state_directory}[/blue]"
+
+        # Render table, next steps and footer in a single print
+        console.print(
+            Group(table, Text.from_markup("\n".join(next_steps)), Text.from_markup(footer))
+        )
 
     @staticmethod
     def display_dry_run_preview(changes: list) -> None:
@@ -160,13 +181,14 @@ class StatusFormatter:
         Args:
             changes: List of change objects with documentation_file_path and suggested_changes
         """
-        console.print("\n[yellow]Dry run - showing suggestions without applying:[/yellow]")
+        lines = ["\n[yellow]Dry run - showing suggestions without applying:[/yellow]"]
         for change in changes:
-            console.print(f"  • {change.documentation_file_path} ({change.change_type})")
+            lines.append(f"  • {change.documentation_file_path} ({change.change_type})")
             if change.suggested_changes:
                 for suggestion in change.suggested_changes[:2]:  # Show first 2
                     text = suggestion.suggestion
                     preview = text[:80] if len(text) > 80 else text
-                    console.print(f"    - {preview}...")
-        console.print(f"\n[yellow]Total changes: {len(changes)}[/yellow]")
-        console.print("[yellow]Run without --dry-run to apply changes[/yellow]")
+                    lines.append(f"    - {preview}...")
+        lines.append(f"\n[yellow]Total changes: {len(changes)}[/yellow]")
+        lines.append("[yellow]Run without --dry-run to apply changes[/yellow]")
+        console.print("\n".join(lines))
@@ -2,43 +2,61 @@
 
 import asyncio
 from collections.abc import Callable, Iterable
+from contextlib import suppress
+from operator import length_hint
 from typing import Any
 
 from rich.progress import (
     BarColumn,
     MofNCompleteColumn,
     Progress,
+    ProgressColumn,
     SpinnerColumn,
     TaskProgressColumn,
     TextColumn,
 )
 
 
+def _bar_columns() -> tuple[ProgressColumn, ...]:
+    """Build the column layout shared by all determinate progress bars.
+
+    Rich columns cache rendered output per instance, so a fresh set is
+    created for every Progress rather than sharing module-level singletons.
+
+    Returns:
+        Columns for description, bar, percentage and completed/total count
+    """
+    return (
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TaskProgressColumn(),
+        MofNCompleteColumn(),
+    )
+
+
 class ProgressReporter:
     """Unified progress tracking for various CLI operations."""
 
     @staticmethod
-    def track_iterable(items: Iterable[Any], description: str) -> Iterable[Any]:
+    def track_iterable(
+        items: Iterable[Any], description: str, total: int | None = None
+    ) -> Iterable[Any]:
         """Track progress through an iterable with a progress bar.
 
+        Items are yielded lazily; the iterable is never materialized.
+
         Args:
             items: Iterable to track
             description: Description of the operation
+            total: Total number of items (inferred from the iterable when possible)
 
         Yields:
             Items from the iterable
         """
-        items_list = list(items)
-        with Progress(
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            MofNCompleteColumn(),
-        ) as progress:
-            task = progress.add_task(description, total=len(items_list))
-            for item in items_list:
-                yield item
-                progress.update(task, advance=1)
+        if total is None:
+            total = length_hint(items) or None
+        with Progress(*_bar_columns()) as progress:
+            yield from progress.track(items, total=total, description=description)
 
     @staticmethod
     async def track_async(
@@ -49,29 +67,36 @@ class ProgressReporter:
     ) -> None:
         """Track progress through async operations with concurrency control.
 
+        A fixed pool of ``concurrency`` workers drains a bounded queue, so only
+        a handful of items are in flight regardless of how many are tracked.
+        Failures of individual items are swallowed and do not advance the bar.
+
         Args:
             items: List of items to process
             processor: Async function to process each item
             description: Description of the operation
             concurrency: Maximum concurrent operations
         """
-        with Progress(
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            MofNCompleteColumn(),
-        ) as progress:
+        with Progress(*_bar_columns()) as progress:
             task = progress.add_task(description, total=len(items))
-            semaphore = asyncio.Semaphore(concurrency)
+            queue: asyncio.Queue[str | None] = asyncio.Queue(maxsize=concurrency * 2)
+
+            async def produce() -> None:
+                for item in items:
+                    await queue.put(item)
+                for _ in range(concurrency):
+                    await queue.put(None)
 
-            async def process_with_semaphore(item: str) -> Any:
-                async with semaphore:
-                    result = await processor(item)
-                    progress.update(task, advance=1)
-                    return result
+            async def work() -> None:
+                while (item := await queue.get()) is not None:
+                    with suppress(Exception):
+                        await processor(item)
+                        progress.update(task, advance=1)
 
-            tasks = [process_with_semaphore(item) for item in items]
-            await asyncio.gather(*tasks, return_exceptions=True)
+            async with asyncio.TaskGroup() as group:
+                group.create_task(produce())
+                for _ in range(concurrency):
+                    group.create_task(work())
 
     @staticmethod
     def spinner(description: str) -> Progress:
@@ -116,29 +141,18 @@ class ProgressReporter:
         async def scan_with_progress() -> None:
             """Process files with progress tracking and state management."""
             state = scanner._load_state()
-            semaphore = asyncio.Semaphore(concurrency)
 
             async def process_file(file_path: str) -> None:
-                async with semaphore:
-                    state_item = state.get(file_path, {}).copy()
-                    if not state_item.get("skipped") and not state_item.get("summary"):
-                        updated = await scanner.describe_async(file_path, state_item)
-                        state[file_path] = updated
-
-            with Progress(
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TaskProgressColumn(),
-                MofNCompleteColumn(),
-            ) as progress:
-                task = progress.add_task(description, total=len(files_to_process))
-
-                async def process_with_progress(file_path: str) -> None:
-                    await process_file(file_path)
-                    progress.update(task, advance=1)
-
-                tasks = [process_with_progress(fp) for fp in files_to_process]
-                await asyncio.gather(*tasks, return_exceptions=True)
+                state_item = state.get(file_path, {})
+                if not state_item.get("skipped") and not state_item.get("summary"):
+                    # describe_async writes into the item it is given; copy so a
+                    # failed describe never leaves a half-updated entry behind.
+                    updated = await scanner.describe_async(file_path, dict(state_item))
+                    state[file_path] = updated
+
+            await ProgressReporter.track_async(
+                files_to_process, process_file, description, concurrency
+            )
 
             scanner._save_state(state)
 
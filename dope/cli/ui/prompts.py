@@ -1,15 +1,18 @@
-"""Interactive prompts using questionary."""
+"""Interactive prompts using questionary.
+
+questionary pulls in prompt_toolkit, which is slow to import, so it is
+imported inside each prompt rather than at module load.
+"""
 
 import functools
+import os
 import sys
 from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
-import questionary
 from git import Repo
 from pydantic import HttpUrl, SecretStr, ValidationError
-from questionary import Choice
 
 from dope.models.constants import DEFAULT_DOC_SUFFIX, DOC_SUFFIX, EXCLUDE_DIRS
 from dope.models.enums import Provider
@@ -47,6 +50,8 @@ def text_input(message: str, default: str = "", validate: Callable | None = None
     Returns:
         User input string
     """
+    import questionary
+
     return questionary.text(message=message, default=default, validate=validate).ask()
 
 
@@ -61,6 +66,8 @@ def select(message: str, choices: list, default: str | None = None) -> Any:
     Returns:
         Selected value
     """
+    import questionary
+
     return questionary.select(message=message, choices=choices, default=default).ask()
 
 
@@ -73,12 +80,16 @@ def confirm(message: str) -> bool:
     Returns:
         True if confirmed, False otherwise
     """
+    import questionary
+
     return questionary.confirm(message).ask()
 
 
 @handle_questionary_abort
 def prompt_doc_root() -> Path:
     """Prompt for documentation root directory."""
+    import questionary
+
     return Path(
         questionary.path(
             "Set path to doc root folder", only_directories=True, default=str(Path(".").resolve())
@@ -89,8 +100,10 @@ def prompt_doc_root() -> Path:
 @handle_questionary_abort
 def prompt_doc_types() -> set[FileSuffix]:
     """Prompt for documentation file types."""
+    import questionary
+
     choices = [
-        Choice(title=suffix, value=suffix, checked=suffix in DEFAULT_DOC_SUFFIX)
+        questionary.Choice(title=suffix, value=suffix, checked=suffix in DEFAULT_DOC_SUFFIX)
         for suffix in sorted(DOC_SUFFIX)
     ]
     return set(questionary.checkbox("Select doc file types.", choices=choices).ask())
@@ -99,27 +112,29 @@ def prompt_doc_types() -> set[FileSuffix]:
 @handle_questionary_abort
 def prompt_provider() -> Provider:
     """Prompt for LLM provider selection."""
+    import questionary
+
     return questionary.select(
         message="Which LLM provider?",
-        choices=[Choice(title=provider.value, value=provider) for provider in Provider],
+        choices=[questionary.Choice(title=provider.value, value=provider) for provider in Provider],
     ).ask()
 
 
 @handle_questionary_abort
 def prompt_exclude_folders(doc_root: Path) -> set[str]:
     """Prompt for folders to exclude from documentation scanning."""
-    doc_root = Path(doc_root)
-
-    def _check_folder(file: Path):
-        if file.name.startswith("."):
-            return True
-        return file.name in EXCLUDE_DIRS
-
-    choices = [
-        Choice(title=file.name, value=file.name, checked=_check_folder(file))
-        for file in doc_root.iterdir()
-        if file.is_dir()
-    ]
+    import questionary
+
+    with os.scandir(doc_root) as entries:
+        choices = [
+            questionary.Choice(
+                title=entry.name,
+                value=entry.name,
+                checked=entry.name.startswith(".") or entry.name in EXCLUDE_DIRS,
+            )
+            for entry in entries
+            if entry.is_dir()
+        ]
     if choices:
         result = questionary.checkbox(
             message="Select folders to exclude from doc scan", choices=choices
@@ -131,6 +146,8 @@ def prompt_exclude_folders(doc_root: Path) -> set[str]:
 @handle_questionary_abort
 def prompt_default_branch(repo_path: str) -> str:
     """Prompt for default Git branch selection."""
+    import questionary
+
     repo = Repo(str(repo_path), search_parent_directories=True)
     branches = [str(branch) for branch in repo.branches]
     return questionary.select("Select default branch", choices=branches, default="main").ask()
@@ -139,6 +156,8 @@ def prompt_default_branch(repo_path: str) -> str:
 @handle_questionary_abort
 def prompt_code_repo_root() -> Path:
     """Prompt for code repository root directory."""
+    import questionary
+
     suggested_root = Repo(".", search_parent_directories=True)
     return Path(
         questionary.path(
@@ -162,18 +181,24 @@ def validate_url(text: str) -> bool | str:
 @handle_questionary_abort
 def prompt_deployment_endpoint() -> str:
     """Prompt for Azure deployment URL."""
+    import questionary
+
     return questionary.text(message="Azure deployment URL:", validate=validate_url).ask()
 
 
 @handle_questionary_abort
 def prompt_token() -> SecretStr:
     """Prompt for API token."""
+    import questionary
+
     return SecretStr(questionary.password("Input API token").ask())
 
 
 @handle_questionary_abort
 def prompt_state_directory() -> Path:
     """Prompt for state directory path."""
+    import questionary
+
     cache_dir = Path(".") / Path(".dope")
     return Path(
         questionary.path("Set state directory path", default=str(cache_dir.resolve())).ask()
@@ -183,4 +208,6 @@ def prompt_state_directory() -> Path:
 @handle_questionary_abort
 def prompt_add_cache_to_git() -> bool:
     """Prompt whether to add cache directory to Git."""
+    import questionary
+
     return questionary.confirm("Add cache dir to git?").ask()
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
 
+from dope.core.tree import get_structure
+
 
 class BaseConsumer(ABC):
     """Base consumer class for file discovery and content access.
@@ -37,6 +39,4 @@ class BaseConsumer(ABC):
         Returns:
             String representation of directory tree
         """
-        from dope.core.tree import get_structure
-
-        return get_structure(paths, base_dir=Path("."))
+        return get_structure(paths)
@@ -1,5 +1,7 @@
+import threading
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Literal
+from typing import Literal, NamedTuple
 
 from git import Repo
 
@@ -7,6 +9,31 @@ from dope.consumers.base import BaseConsumer
 from dope.exceptions import DocumentNotFoundError
 from dope.models.domain.code import CodeMetadata
 
+# Read size for counting lines of code without decoding files
+_READ_CHUNK_SIZE = 1 << 20
+
+# Diffs kept per consumer; a file's diffs are requested back to back during a scan
+_DIFF_CACHE_SIZE = 256
+
+
+class DiffStat(NamedTuple):
+    """Line counts for one changed file, as reported by ``git diff --numstat``.
+
+    Attributes:
+        lines_added: Lines added (0 for binary files)
+        lines_deleted: Lines deleted (0 for binary files)
+        rename_similarity: Similarity percentage if the file was renamed, else None
+    """
+
+    lines_added: int
+    lines_deleted: int
+    rename_similarity: int | None = None
+
+
+def _numstat_count(field: str) -> int:
+    """Parse a numstat line count, which git reports as "-" for binary files."""
+    return 0 if field == "-" else int(field)
+
 
 class GitConsumer(BaseConsumer):
     """Git consumer for repository operations.
@@ -25,8 +52,10 @@ class GitConsumer(BaseConsumer):
         """
         self.base_branch = base_branch
         self.repo = self._get_repo(root_path)
-        # Use git's root, not the provided path
-        super().__init__(Path(self.repo.git.rev_parse("--show-toplevel")))
+        self._diff_cache: dict[tuple[str, tuple[str, ...]], bytes] = {}
+        self._diff_cache_lock = threading.Lock()
+        # Use git's root, not the provided path (GitPython resolves it without a subprocess)
+        super().__init__(Path(self.repo.working_tree_dir))
 
     @staticmethod
     def _get_repo(root_path):
@@ -62,8 +91,14 @@ class GitConsumer(BaseConsumer):
         return [Path(path) for path in file_list]
 
     def _get_all_files(self):
-        file_list = self.repo.git.ls_files().splitlines()
-        return [Path(path) for path in file_list]
+        return list(self._iter_all_files())
+
+    def _iter_all_files(self) -> Iterator[Path]:
+        # Stream ls-files output rather than buffering it whole for large repos
+        process = self.repo.git.ls_files(as_process=True)
+        for line in process.stdout:
+            yield Path(line.decode("utf-8").rstrip("\n"))
+        process.wait()
 
     def get_content(self, file_path, normalize_whitespace: bool = False) -> bytes:
         """Return diff content of changed file as bytes.
@@ -75,14 +110,12 @@ class GitConsumer(BaseConsumer):
         Returns:
             Diff content as bytes.
         """
-        args = [self.base_branch, f"--unified={5}"]
+        flags = [f"--unified={5}"]
 
         if normalize_whitespace:
-            args.extend(["-w", "-b", "--ignore-blank-lines"])
+            flags.extend(["-w", "-b", "--ignore-blank-lines"])
 
-        args.extend(["--", str(file_path)])
-        diff = self.repo.git.diff(*args)
-        return diff.encode("utf-8")
+        return self._diff(file_path, *flags)
 
     def get_normalized_diff(self, file_path) -> bytes:
         """Get whitespace-normalized diff for better comparison.
@@ -98,21 +131,98 @@ class GitConsumer(BaseConsumer):
         Returns:
             Normalized diff content as bytes.
         """
-        diff = self.repo.git.diff(
-            self.base_branch,
+        return self._diff(
+            file_path,
             "-w",  # ignore whitespace
             "-b",  # ignore blank lines
             "--ignore-blank-lines",
             "--diff-algorithm=histogram",
             f"--unified={5}",
-            "--",
-            str(file_path),
         )
-        return diff.encode("utf-8")
+
+    def _diff(self, file_path, *flags: str) -> bytes:
+        """Run ``git diff`` against the base branch for one file, memoized per flags.
+
+        A scan asks for the same file's diff several times (term boost,
+        whitespace check, content hash, LLM prompt); each distinct diff is
+        computed once per consumer. The cache keeps the most recent
+        ``_DIFF_CACHE_SIZE`` diffs and is shared by the scan's worker threads.
+
+        Args:
+            file_path: Path to the file to get diff for.
+            *flags: Extra ``git diff`` options.
+
+        Returns:
+            Diff content as bytes.
+        """
+        key = (str(file_path), flags)
+        with self._diff_cache_lock:
+            cached = self._diff_cache.get(key)
+        if cached is not None:
+            return cached
+        diff = self.repo.git.diff(self.base_branch, *flags, "--", str(file_path)).encode("utf-8")
+        with self._diff_cache_lock:
+            if len(self._diff_cache) >= _DIFF_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del self._diff_cache[next(iter(self._diff_cache))]
+            self._diff_cache[key] = diff
+        return diff
+
+    def get_diff_stats(
+        self, branch_name: str | None = None, paths: list[Path] | None = None
+    ) -> dict[str, DiffStat]:
+        """Return line counts and renames for changed files in one git call.
+
+        By default the whole tree is diffed at once so that renames can be
+        paired with their source path, which a single-file pathspec cannot do.
+
+        Args:
+            branch_name (str, optional): Branch to compare against. Uses base_branch if None.
+            paths (list[Path], optional): Limit the diff to these paths. Whole tree if None.
+
+        Returns:
+            dict[str, DiffStat]: Stats keyed by the file's current (post-rename) path.
+        """
+        ref = branch_name if branch_name else self.base_branch
+        pathspec = [str(path) for path in paths] if paths else ["."]
+        output = self.repo.git.diff(ref, "-M90%", "--raw", "--numstat", "-z", "--", *pathspec)
+        tokens = output.split("\0")
+
+        similarity: dict[str, int] = {}
+        stats: dict[str, DiffStat] = {}
+        i = 0
+        while i < len(tokens):
+            token = tokens[i]
+            if not token:
+                i += 1
+            elif token.startswith(":"):
+                # Raw record: ":<modes> <shas> <status>\0<path>[\0<new path>]"
+                status = token.rsplit(" ", 1)[-1]
+                if status.startswith("R"):
+                    similarity[tokens[i + 2]] = int(status[1:])
+                    i += 3
+                else:
+                    i += 2
+            else:
+                # Numstat record: "<added>\t<deleted>\t<path>", or an empty
+                # path followed by "<old path>\0<new path>" for renames
+                added, _, rest = token.partition("\t")
+                deleted, _, path = rest.partition("\t")
+                if path:
+                    i += 1
+                else:
+                    path = tokens[i + 2]
+                    i += 3
+                stats[path] = DiffStat(_numstat_count(added), _numstat_count(deleted))
+
+        for path, percent in similarity.items():
+            if path in stats:
+                stats[path] = stats[path]._replace(rename_similarity=percent)
+        return stats
 
     def get_full_content(self, file_path):
         """Return content of code file."""
-        code_path = Path(self.repo.working_tree_dir) / file_path
+        code_path = self.root_path / file_path
 
         if code_path.is_file():
             with code_path.open("r") as file:
@@ -121,15 +231,19 @@ class GitConsumer(BaseConsumer):
             raise DocumentNotFoundError(str(code_path))
 
     def _get_lines_of_code(self):
-        all_files = self._get_all_files()
-
         loc = 0
-        for p in all_files:
+        for p in self._iter_all_files():
             try:
-                for _ in (self.root_path / p).open("r", errors="ignore"):
-                    loc += 1
-            except (OSError, UnicodeDecodeError):
+                with (self.root_path / p).open("rb") as file:
+                    last = b""
+                    while chunk := file.read(_READ_CHUNK_SIZE):
+                        loc += chunk.count(b"\n")
+                        last = chunk
+            except OSError:
                 continue
+            # A final line without a trailing newline still counts
+            if last and not last.endswith(b"\n"):
+                loc += 1
         return loc
 
     def get_metadata(self, branch_name: str | None = None) -> CodeMetadata:
@@ -141,13 +255,18 @@ class GitConsumer(BaseConsumer):
         Returns:
             CodeMetadata: metadata about repo.
         """
-        commits = list(self.repo.iter_commits(branch_name or self.base_branch))
-        contributors = sorted({c.author.email or c.author.name for c in commits})
+        ref = branch_name or self.base_branch
+        # Let git count and list authors instead of building a Commit object per commit
+        commits = int(self.repo.git.rev_list("--count", ref))
+        contributors = set()
+        for line in self.repo.git.log("--format=%ae%x09%an", ref).splitlines():
+            email, _, name = line.partition("\t")
+            contributors.add(email or name)
         branches = [h.name for h in self.repo.heads]
         tags = [t.name for t in self.repo.tags]
 
         return CodeMetadata(
-            commits=len(commits),
+            commits=commits,
             num_contributors=len(contributors),
             branches=branches,
             tags=tags,
@@ -5,6 +5,9 @@ processing priority and skip trivial files before expensive LLM operations.
 """
 
 import fnmatch
+import os
+import re
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -47,6 +50,36 @@ DOC_CRITICAL_PATTERNS: dict[str, list[str]] = {
 }
 
 
+# Path substrings that imply a change category, checked in priority order
+CATEGORY_PATH_HINTS: dict[ChangeCategory, list[str]] = {
+    ChangeCategory.CLI: ["cli/", "commands/", "_cli.py"],
+    ChangeCategory.API: ["api/", "endpoints/", "routes/", "views/"],
+    ChangeCategory.CONFIG: [
+        "config",
+        "pyproject.toml",
+        "setup.py",
+        "requirements.txt",
+        ".env",
+        "settings",
+    ],
+    ChangeCategory.ARCHITECTURE: ["__init__.py", "architecture/", "core/", "models/domain/"],
+    ChangeCategory.TESTING: ["test_", "_test.py", "tests/", "test/", ".spec.", "conftest.py"],
+    ChangeCategory.SECURITY: ["security/", "auth", "crypto", "secrets"],
+    ChangeCategory.DEPLOYMENT: ["deploy", "docker", "kubernetes", "k8s", ".yml", ".yaml", "ci/"],
+    ChangeCategory.DOCUMENTATION: ["docs/", "readme", ".md", ".rst"],
+}
+
+# One lookahead per category, tried in table order at the start of the path, so
+# the first category with a matching substring anywhere in the path wins.
+_CATEGORY_REGEX = re.compile(
+    "|".join(
+        f"(?=.*?(?:{'|'.join(map(re.escape, hints))}))(?P<{category.name}>)"
+        for category, hints in CATEGORY_PATH_HINTS.items()
+    ),
+    re.DOTALL,
+)
+
+
 @dataclass
 class FileClassification:
     """Classification of a file based on path analysis.
@@ -90,6 +123,31 @@ class ChangeMagnitude:
             self.related_docs = []
 
 
+def _compile_patterns(
+    patterns: dict[str, list[str]],
+) -> tuple[re.Pattern[str], list[tuple[str, str]]]:
+    """Compile categorized glob patterns into a single alternation regex.
+
+    Each pattern becomes a named group ``p<index>``, so one ``match`` both
+    tests every pattern in declaration order and identifies the winner.
+
+    Args:
+        patterns: Mapping of category name to glob patterns.
+
+    Returns:
+        Tuple of the compiled regex and the (category, pattern) list indexed
+        by group number.
+    """
+    entries = [(category, pattern) for category, globs in patterns.items() for pattern in globs]
+    if not entries:
+        return re.compile(r"(?!)"), entries
+    alternatives = (
+        f"(?P<p{index}>{fnmatch.translate(os.path.normcase(pattern.lower()))})"
+        for index, (_, pattern) in enumerate(entries)
+    )
+    return re.compile("|".join(alternatives)), entries
+
+
 class FileClassifier:
     """Classifies files based on path patterns for filtering.
 
@@ -124,6 +182,8 @@ class FileClassifier:
         """
         self._trivial_patterns = trivial_patterns or TRIVIAL_FILE_PATTERNS
         self._critical_patterns = critical_patterns or DOC_CRITICAL_PATTERNS
+        self._trivial_regex, self._trivial_entries = _compile_patterns(self._trivial_patterns)
+        self._critical_regex, self._critical_entries = _compile_patterns(self._critical_patterns)
 
     def classify(self, file_path: Path) -> FileClassification:
         """Classify a file based on its path.
@@ -136,27 +196,28 @@ class FileClassifier:
         Returns:
             FileClassification with classification, reason, and matched pattern.
         """
-        path_str = str(file_path).lower()
+        # Same normalization fnmatch.fnmatch applies to both name and pattern
+        path_str = os.path.normcase(str(file_path).lower())
 
         # Check for trivial files to skip
-        for category, patterns in self._trivial_patterns.items():
-            for pattern in patterns:
-                if fnmatch.fnmatch(path_str, pattern.lower()):
-                    return FileClassification(
-                        classification="SKIP",
-                        reason=f"Trivial file type: {category}",
-                        matched_pattern=pattern,
-                    )
+        match = self._trivial_regex.match(path_str)
+        if match:
+            category, pattern = self._trivial_entries[int(match.lastgroup[1:])]
+            return FileClassification(
+                classification="SKIP",
+                reason=f"Trivial file type: {category}",
+                matched_pattern=pattern,
+            )
 
         # Check for critical files to prioritize
-        for category, patterns in self._critical_patterns.items():
-            for pattern in patterns:
-                if fnmatch.fnmatch(path_str, pattern.lower()):
-                    return FileClassification(
-                        classification="HIGH",
-                        reason=f"Critical file type: {category}",
-                        matched_pattern=pattern,
-                    )
+        match = self._critical_regex.match(path_str)
+        if match:
+            category, pattern = self._critical_entries[int(match.lastgroup[1:])]
+            return FileClassification(
+                classification="HIGH",
+                reason=f"Critical file type: {category}",
+                matched_pattern=pattern,
+            )
 
         # Default to normal priority
         return FileClassification(
@@ -165,6 +226,11 @@ class FileClassifier:
         )
 
 
+# Lower bounds of each change-volume bucket and the score it maps to
+_VOLUME_THRESHOLDS = (1, 5, 20, 50, 100)
+_VOLUME_SCORES = (0.0, 0.2, 0.4, 0.6, 0.8, 1.0)
+
+
 def calculate_magnitude_score(
     lines_added: int,
     lines_deleted: int,
@@ -182,21 +248,8 @@ def calculate_magnitude_score(
     Returns:
         Score from 0.0 to 1.0, higher means more significant
     """
-    total_lines = lines_added + lines_deleted
-
     # Base score on change volume
-    if total_lines == 0:
-        score = 0.0
-    elif total_lines < 5:
-        score = 0.2
-    elif total_lines < 20:
-        score = 0.4
-    elif total_lines < 50:
-        score = 0.6
-    elif total_lines < 100:
-        score = 0.8
-    else:
-        score = 1.0
+    score = _VOLUME_SCORES[bisect_right(_VOLUME_THRESHOLDS, lines_added + lines_deleted)]
 
     # Reduce score for renames (mostly trivial)
     if is_rename and rename_similarity and rename_similarity > 95:
@@ -222,57 +275,5 @@ def infer_change_category(file_path: Path) -> ChangeCategory | None:
         >>> infer_change_category(Path("pyproject.toml"))
         ChangeCategory.CONFIG
     """
-    path_str = str(file_path).lower()
-
-    # CLI patterns
-    if any(pattern in path_str for pattern in ["cli/", "commands/", "_cli.py"]):
-        return ChangeCategory.CLI
-
-    # API patterns
-    if any(pattern in path_str for pattern in ["api/", "endpoints/", "routes/", "views/"]):
-        return ChangeCategory.API
-
-    # Configuration patterns
-    if any(
-        pattern in path_str
-        for pattern in [
-            "config",
-            "pyproject.toml",
-            "setup.py",
-            "requirements.txt",
-            ".env",
-            "settings",
-        ]
-    ):
-        return ChangeCategory.CONFIG
-
-    # Architecture patterns
-    if any(
-        pattern in path_str
-        for pattern in ["__init__.py", "architecture/", "core/", "models/domain/"]
-    ):
-        return ChangeCategory.ARCHITECTURE
-
-    # Testing patterns
-    if any(
-        pattern in path_str
-        for pattern in ["test_", "_test.py", "tests/", "test/", ".spec.", "conftest.py"]
-    ):
-        return ChangeCategory.TESTING
-
-    # Security patterns
-    if any(pattern in path_str for pattern in ["security/", "auth", "crypto", "secrets"]):
-        return ChangeCategory.SECURITY
-
-    # Deployment patterns
-    if any(
-        pattern in path_str
-        for pattern in ["deploy", "docker", "kubernetes", "k8s", ".yml", ".yaml", "ci/"]
-    ):
-        return ChangeCategory.DEPLOYMENT
-
-    # Documentation patterns
-    if any(pattern in path_str for pattern in ["docs/", "readme", ".md", ".rst"]):
-        return ChangeCategory.DOCUMENTATION
-
-    return None
+    match = _CATEGORY_REGEX.match(str(file_path).lower())
+    return ChangeCategory[match.lastgroup] if match else None
@@ -8,6 +8,13 @@ from pydantic_settings import BaseSettings
 from dope.models.constants import APP_NAME
 from dope.models.domain.scope import ScopeTemplate
 
+try:
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper
+    from yaml import SafeLoader as _YamlLoader
+
 
 def load_settings_from_yaml(config_filepath: Path) -> dict:
     """Load settings from YAML configuration file.
@@ -19,7 +26,7 @@ def load_settings_from_yaml(config_filepath: Path) -> dict:
         Dictionary of settings loaded from file
     """
     with config_filepath.open() as file:
-        return yaml.safe_load(file)
+        return yaml.load(file, Loader=_YamlLoader)
 
 
 def load_scope_from_yaml(scope_filepath: Path) -> ScopeTemplate:
@@ -35,12 +42,12 @@ def load_scope_from_yaml(scope_filepath: Path) -> ScopeTemplate:
         FileNotFoundError: If scope file doesn't exist
         ValueError: If scope file is invalid
     """
-    if not scope_filepath.exists():
-        raise FileNotFoundError(f"Scope file not found: {scope_filepath}")
-
-    with scope_filepath.open() as file:
-        data = yaml.safe_load(file)
-        return ScopeTemplate(**data)
+    try:
+        with scope_filepath.open() as file:
+            data = yaml.load(file, Loader=_YamlLoader)
+    except FileNotFoundError as err:
+        raise FileNotFoundError(f"Scope file not found: {scope_filepath}") from err
+    return ScopeTemplate(**data)
 
 
 def generate_local_config_file(config_filename: str, settings_to_write: BaseSettings) -> None:
@@ -54,8 +61,11 @@ def generate_local_config_file(config_filename: str, settings_to_write: BaseSett
     dope_local_config_path = base_path / Path(config_filename)
 
     with open(dope_local_config_path, "w", encoding="utf-8") as file:
-        yaml.safe_dump(
-            settings_to_write.model_dump(mode="json", exclude_none=True), file, sort_keys=False
+        yaml.dump(
+            settings_to_write.model_dump(mode="json", exclude_none=True),
+            file,
+            Dumper=_YamlDumper,
+            sort_keys=False,
         )
 
 
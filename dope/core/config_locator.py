@@ -1,5 +1,7 @@
 """Configuration file location utilities."""
 
+import os
+from functools import lru_cache
 from pathlib import Path
 
 from git import InvalidGitRepositoryError, Repo
@@ -18,11 +20,24 @@ def find_project_root(start: Path | None = None) -> Path:
         Path to project root, or start path if not a Git repository
     """
     start = start or Path.cwd()
+    return _find_git_root(start.resolve()) or start
+
+
+@lru_cache(maxsize=16)
+def _find_git_root(start: Path) -> Path | None:
+    """Open the enclosing Git repository once per directory and return its working tree.
+
+    Args:
+        start: Resolved directory to search upwards from
+
+    Returns:
+        Path to the repository working tree, or None if not inside a Git repository
+    """
     try:
         repo = Repo(start, search_parent_directories=True)
-        return Path(repo.working_tree_dir) if repo.working_tree_dir else start
     except InvalidGitRepositoryError:
-        return start
+        return None
+    return Path(repo.working_tree_dir) if repo.working_tree_dir else None
 
 
 def locate_local_config_file(config_file_name: str) -> Path | None:
@@ -36,21 +51,20 @@ def locate_local_config_file(config_file_name: str) -> Path | None:
     Returns:
         Path to config file if found, None otherwise
     """
-    start = Path.cwd()
-    root = find_project_root(start)
-
-    current = start.resolve()
-    root = root.resolve()
+    start = os.getcwd()
+    current = os.path.realpath(start)
+    root = os.path.realpath(find_project_root(Path(start)))
 
     while True:
-        candidate = current / config_file_name
-        if candidate.is_file():
-            return candidate
+        candidate = os.path.join(current, config_file_name)
+        if os.path.isfile(candidate):
+            return Path(candidate)
         if current == root:
-            break
-        current = current.parent
-
-    return None
+            return None
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
 
 
 def locate_global_config(config_file_name: str) -> Path | None:
@@ -62,8 +76,8 @@ def locate_global_config(config_file_name: str) -> Path | None:
     Returns:
         Path to global config file if it exists, None otherwise
     """
-    config_filepath = Path(user_config_dir(APP_NAME)) / Path(config_file_name)
+    config_filepath = os.path.join(user_config_dir(APP_NAME), config_file_name)
 
-    if config_filepath.is_file():
-        return config_filepath
+    if os.path.isfile(config_filepath):
+        return Path(config_filepath)
     return None
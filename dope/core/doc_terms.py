@@ -5,12 +5,127 @@ when code changes touch documented concepts, boosting their relevance.
 """
 
 import json
+import multiprocessing
+import os
 import re
-from collections import defaultdict
+import sys
+import threading
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from itertools import chain, repeat
 from pathlib import Path
 
+from dope.core.pattern_utils import extract_file_paths_from_text, normalize_code_path
+
+# Any non-letter, non-digit character separates terms, so accented words stay whole
+_SEP_RE = re.compile(r"[\W_]+")
+# Same separators as _SEP_RE for ASCII text: every non-alphanumeric character becomes a space
+_ASCII_SEP_TABLE = str.maketrans({char: " " for char in map(chr, range(128)) if not char.isalnum()})
+_CAMEL_RE = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+")
+# Components of a path token, keeping snake_case and kebab-case compounds whole
+_PATH_PART_RE = re.compile(r"[\w\-]{3,}")
+
+# Below this many docs, process pool start-up costs more than tokenizing in-process.
+# Forked workers start in ~20ms; spawned ones (macOS/Windows default) re-import the
+# dope/pydantic/GitPython stack, measured at ~2.5s against ~0.3ms to index one doc.
+_PARALLEL_MIN_DOCS = 200
+_PARALLEL_MIN_DOCS_SPAWN = 10_000
+_PARALLEL_CHUNKSIZE = 32
+
+# Number of recently tokenized diffs/summaries kept per index
+_TERMS_CACHE_SIZE = 64
+
+# Category keywords (order matters - check specific before general)
+_SECTION_CATEGORY_KEYWORDS = {
+    "cli": ["command", "cli", "arguments", "flags", "option"],
+    "api": ["api", "endpoint", "route", "rest", "graphql", "http"],
+    "config": ["config", "setting", "environment"],
+    "architecture": ["architecture", "design", "structure", "pattern"],
+    "testing": ["test", "testing", "pytest", "unittest"],
+    "documentation": ["document", "readme", "guide", "tutorial"],
+    "dependencies": ["dependency", "package", "requirement", "install"],
+    "performance": ["performance", "optimization", "speed", "benchmark"],
+    "security": ["security", "auth", "permission", "credential"],
+}
+
+# One lookahead per category, tried in table order, so the first category with a
+# keyword anywhere in the section name wins.
+_SECTION_CATEGORY_REGEX = re.compile(
+    "|".join(
+        f"(?=.*?(?:{'|'.join(map(re.escape, keywords))}))(?P<{category}>)"
+        for category, keywords in _SECTION_CATEGORY_KEYWORDS.items()
+    ),
+    re.DOTALL,
+)
+
+
+@lru_cache(maxsize=1024)
+def _infer_section_category(section_name: str) -> str:
+    """Infer change category from section name, cached per distinct name.
+
+    Args:
+        section_name: Documentation section name
+
+    Returns:
+        Category string, or "general" if no keyword matches
+    """
+    match = _SECTION_CATEGORY_REGEX.match(section_name.lower())
+    return match.lastgroup if match else "general"
+
+
+def _summarized_docs(doc_state: dict) -> dict[str, dict]:
+    """Select the docs that can be indexed.
+
+    Args:
+        doc_state: Documentation state from DescriberService
+
+    Returns:
+        Docs that have a summary and were not skipped
+    """
+    return {
+        doc_path: doc_data for doc_path, doc_data in doc_state.items() if _is_indexable(doc_data)
+    }
+
+
+def _is_indexable(doc_data: dict) -> bool:
+    """Whether a doc state entry has a summary and was not skipped."""
+    return bool(doc_data.get("summary")) and not doc_data.get("skipped")
+
+
+def _hashes_path(index_path: Path) -> Path:
+    """Path of the doc hashes file saved next to an index (doc-terms.hashes.json)."""
+    return index_path.with_suffix(".hashes.json")
+
+
+def _freeze_postings(postings: Mapping[str, Iterable[str]]) -> dict[str, frozenset[str]]:
+    """Freeze posting lists once the index is built.
+
+    Doc paths are interned so every posting list shares one string per doc.
+
+    Args:
+        postings: Mapping of term to the doc paths mentioning it
 
-class DocTermIndex:
+    Returns:
+        Mapping of term to an immutable set of doc paths
+    """
+    return {term: frozenset(sys.intern(doc) for doc in docs) for term, docs in postings.items()}
+
+
+def _parallel_min_docs() -> int:
+    """Smallest doc count worth indexing in worker processes.
+
+    Returns:
+        Doc count threshold for the current multiprocessing start method
+    """
+    if multiprocessing.get_start_method() == "fork":
+        return _PARALLEL_MIN_DOCS
+    return _PARALLEL_MIN_DOCS_SPAWN
+
+
+class DocTermIndex:  # pylint: disable=too-many-instance-attributes
     """Index of significant terms extracted from documentation.
 
     Builds an inverted index: term -> set of doc files mentioning it.
@@ -25,11 +140,16 @@ class DocTermIndex:
             index_path: Optional path to persist index as JSON.
         """
         self.index_path = index_path
-        self.term_to_docs: dict[str, set[str]] = defaultdict(set)
+        self.term_to_docs: dict[str, frozenset[str]] = {}
         self.doc_hashes: dict[str, str] = {}  # Track doc versions
         self.code_patterns: dict[str, set[str]] = defaultdict(set)  # category -> patterns
+        # Reverse maps used by update_from_state; None until built or loaded
+        self._doc_terms: dict[str, set[str]] | None = None
+        self._doc_patterns: dict[str, dict[str, set[str]]] | None = None
+        self._terms_cache: dict[str, frozenset[str]] = {}
+        self._terms_cache_lock = threading.Lock()
 
-    def build_from_state(self, doc_state: dict, extract_patterns: bool = True) -> None:  # pylint: disable=too-many-locals
+    def build_from_state(self, doc_state: dict, extract_patterns: bool = True) -> None:
         """Build term index from documentation state.
 
         Extracts terms from:
@@ -42,43 +162,168 @@ class DocTermIndex:
             doc_state: Documentation state from DescriberService
             extract_patterns: If True, extract code patterns from references
         """
-        self.term_to_docs.clear()
-        self.doc_hashes.clear()
-        self.code_patterns.clear()
+        # Start from fresh containers instead of clearing the previous ones in place
+        self.term_to_docs = {}
+        self.doc_hashes = {}
+        self.code_patterns = defaultdict(set)
+        self._doc_terms = {}
+        self._doc_patterns = {}
+
+        docs = _summarized_docs(doc_state)
+        if not docs:
+            return
 
-        for doc_path, doc_data in doc_state.items():
-            # Skip if no summary or if skipped
-            if not doc_data.get("summary") or doc_data.get("skipped"):
-                continue
+        term_to_docs: dict[str, set[str]] = defaultdict(set)
+        indexed = self._index_docs(list(docs.values()), extract_patterns)
 
+        for (doc_path, doc_data), (terms, patterns) in zip(docs.items(), indexed, strict=True):
             # Track doc version
             self.doc_hashes[doc_path] = doc_data.get("hash", "")
 
-            summary = doc_data["summary"]
-            sections = summary.get("sections", [])
+            self._doc_terms[doc_path] = terms
+            self._doc_patterns[doc_path] = patterns
+            for term in terms:
+                term_to_docs[term].add(doc_path)
+            for category, pattern_set in patterns.items():
+                self.code_patterns[category].update(pattern_set)
 
-            for section in sections:
-                section_name = section.get("section_name", "")
+        self.term_to_docs = _freeze_postings(term_to_docs)
 
-                # Extract from references
-                references = section.get("references", [])
-                for ref in references:
-                    # Normalize and extract terms
-                    terms = self._extract_terms(ref)
-                    for term in terms:
-                        self.term_to_docs[term].add(doc_path)
+    def update_from_state(self, doc_state: dict, extract_patterns: bool = True) -> None:
+        """Update the index in place, re-tokenizing only docs whose hash changed.
 
-                    # Extract code patterns if enabled
-                    if extract_patterns:
-                        patterns = self._extract_code_patterns(ref, section_name)
-                        for category, pattern_set in patterns.items():
-                            self.code_patterns[category].update(pattern_set)
+        Postings of unchanged docs are kept as-is. Changed and new docs are
+        re-indexed, and docs no longer in the state are dropped. Falls back to
+        a full build when per-doc patterns are unknown (index saved by an older version).
 
-                # Extract from section names (major topics)
-                if section_name:
-                    terms = self._extract_terms(section_name)
-                    for term in terms:
-                        self.term_to_docs[term].add(doc_path)
+        Args:
+            doc_state: Documentation state from DescriberService
+            extract_patterns: If True, extract code patterns from references
+        """
+        if self._doc_patterns is None and extract_patterns:
+            self.build_from_state(doc_state, extract_patterns=extract_patterns)
+            return
+
+        current = _summarized_docs(doc_state)
+        changed = [
+            doc_path
+            for doc_path, doc_data in current.items()
+            if self.doc_hashes.get(doc_path) != doc_data.get("hash", "")
+        ]
+        removed = [doc_path for doc_path in self.doc_hashes if doc_path not in current]
+        if not changed and not removed:
+            return
+
+        doc_terms = self._get_doc_terms()
+        doc_patterns = self._doc_patterns if self._doc_patterns is not None else {}
+
+        # Thaw only the posting lists touched by changed or removed docs
+        touched: dict[str, set[str]] = {}
+        for doc_path in chain(changed, removed):
+            for term in doc_terms.pop(doc_path, ()):
+                touched.setdefault(term, set(self.term_to_docs.get(term, ()))).discard(doc_path)
+            doc_patterns.pop(doc_path, None)
+            self.doc_hashes.pop(doc_path, None)
+
+        indexed = self._index_docs([current[doc_path] for doc_path in changed], extract_patterns)
+        for doc_path, (terms, patterns) in zip(changed, indexed, strict=True):
+            self.doc_hashes[doc_path] = current[doc_path].get("hash", "")
+            doc_terms[doc_path] = terms
+            doc_patterns[doc_path] = patterns
+            for term in terms:
+                touched.setdefault(term, set(self.term_to_docs.get(term, ()))).add(doc_path)
+
+        for term, docs in touched.items():
+            if docs:
+                self.term_to_docs[term] = frozenset(sys.intern(doc) for doc in docs)
+            else:
+                self.term_to_docs.pop(term, None)
+
+        self._doc_patterns = doc_patterns
+        self.code_patterns = defaultdict(set)
+        for patterns in doc_patterns.values():
+            for category, pattern_set in patterns.items():
+                self.code_patterns[category].update(pattern_set)
+
+    def _index_docs(
+        self, docs: list[dict], extract_patterns: bool
+    ) -> list[tuple[set[str], dict[str, set[str]]]]:
+        """Index several docs, in worker processes when there are enough of them.
+
+        Args:
+            docs: Documentation state entries with summaries
+            extract_patterns: If True, extract code patterns from references
+
+        Returns:
+            (terms, category -> code patterns) for each doc, in input order
+        """
+        if len(docs) >= _parallel_min_docs() and (os.process_cpu_count() or 1) > 1:
+            try:
+                with ProcessPoolExecutor() as executor:
+                    return list(
+                        executor.map(
+                            _index_doc_worker,
+                            docs,
+                            repeat(extract_patterns),
+                            chunksize=_PARALLEL_CHUNKSIZE,
+                        )
+                    )
+            except (OSError, BrokenProcessPool):
+                # No usable worker processes (e.g. sandboxed); index in-process instead
+                pass
+        return [self._index_doc(doc_data, extract_patterns) for doc_data in docs]
+
+    def _index_doc(
+        self, doc_data: dict, extract_patterns: bool
+    ) -> tuple[set[str], dict[str, set[str]]]:
+        """Extract terms and code patterns from a single doc.
+
+        Args:
+            doc_data: Documentation state entry with a summary
+            extract_patterns: If True, extract code patterns from references
+
+        Returns:
+            Tuple of (terms, category -> code patterns) for the doc
+        """
+        terms: set[str] = set()
+        patterns_by_category: dict[str, set[str]] = defaultdict(set)
+
+        for section in doc_data["summary"].get("sections", []):
+            section_name = section.get("section_name", "")
+            references = section.get("references", [])
+
+            # Extract from references
+            for ref in references:
+                terms.update(self._extract_terms(ref))
+
+            # Extract code patterns if enabled, scanning the section's path-like references
+            # (file paths always contain a slash) in one pass; paths never span a newline
+            if extract_patterns:
+                path_refs = "\n".join(ref for ref in references if "/" in ref)
+                patterns = self._extract_code_patterns(path_refs)
+                if patterns:
+                    category = self._infer_category_from_section(section_name)
+                    patterns_by_category[category].update(patterns)
+
+            # Extract from section names (major topics)
+            if section_name:
+                terms.update(self._extract_terms(section_name))
+
+        return terms, dict(patterns_by_category)
+
+    def _get_doc_terms(self) -> dict[str, set[str]]:
+        """Return the doc -> terms reverse map, rebuilding it from postings after a load.
+
+        Returns:
+            Mapping of doc path to the terms it contributes to the index
+        """
+        if self._doc_terms is None:
+            self._doc_terms = defaultdict(set)
+            for term, docs in self.term_to_docs.items():
+                for doc_path in docs:
+                    self._doc_terms[doc_path].add(term)
+            self._doc_terms = dict(self._doc_terms)
+        return self._doc_terms
 
     def _extract_terms(self, text: str) -> set[str]:
         """Extract searchable terms from text.
@@ -95,75 +340,80 @@ class DocTermIndex:
         Returns:
             Set of normalized terms
         """
-        if not text:
+        # Every term has at least 3 characters
+        if len(text) < 3:
             return set()
 
         terms = set()
 
-        # Split into tokens first to handle sentences
-        tokens = text.split()
-
-        for token in tokens:
-            # Extract file paths and split into components
-            # Example: "dope/cli/scan.py" -> ["dope", "cli", "scan", "py"]
-            if "/" in token or "\\" in token:
-                path_parts = re.split(r"[/\\.]", token)
-                for part in path_parts:
-                    if len(part) >= 3:
-                        terms.add(part.lower())
-
-            # Split camelCase and PascalCase but preserve original
-            # Example: "DocSummary" -> ["DocSummary", "doc", "summary"]
-            camel_words = re.findall(r"[A-Z][a-z]+|[a-z]+", token)
-            for word in camel_words:
-                if len(word) >= 3:
-                    terms.add(word.lower())
-
-            # Split snake_case and kebab-case
-            snake_words = re.split(r"[_\-]", token)
-            for word in snake_words:
-                if len(word) >= 3:
-                    terms.add(word.lower())
-
-            # Extract whole words (3+ chars)
-            words = re.findall(r"\b[a-zA-Z]{3,}\b", token)
-            for word in words:
-                terms.add(word.lower())
+        # One pass over separator-delimited chunks (whitespace, path, snake/kebab)
+        # Example: "dope/cli/DocSummary.py" -> ["dope", "cli", "DocSummary", "py"]
+        # ASCII text (the common case) is split by translate() + split(), both in C
+        parts = text.translate(_ASCII_SEP_TABLE).split() if text.isascii() else _SEP_RE.split(text)
+        for part in parts:
+            if len(part) < 3:
+                continue
+            # Keep the whole chunk, then split camelCase/PascalCase and digit-joined words
+            # Example: "DocSummary" -> ["docsummary", "doc", "summary"]
+            # Example: "oauth2client" -> ["oauth2client", "oauth", "client"]
+            lowered = part.lower()
+            terms.add(lowered)
+            if not (part.isalpha() and part.islower()):
+                terms.update(word.lower() for word in _CAMEL_RE.findall(part) if len(word) >= 3)
+
+        # Path components also keep their snake/kebab compounds
+        # Example: "dope/core/doc_terms.py" -> ["dope", "core", "doc_terms"]
+        if "/" in text or "\\" in text:
+            for token in text.split():
+                if "/" in token or "\\" in token:
+                    terms.update(part.lower() for part in _PATH_PART_RE.findall(token))
 
         return terms
 
-    def _extract_code_patterns(self, text: str, section_name: str) -> dict[str, set[str]]:
-        """Extract code patterns from documentation text.
+    def _extract_terms_cached(self, text: str) -> frozenset[str]:
+        """Extract terms from text, reusing the result for recently seen texts.
 
-        Identifies file paths in references and generates normalized glob patterns.
-        Attempts to infer category from section name context.
+        The scope filter scores the same code content once per scope section, so the
+        last few tokenizations are kept on the instance. The cache is guarded by a lock
+        since the index may be shared across worker threads.
 
         Args:
-            text: Reference text that may contain file paths
-            section_name: Section name for category inference
+            text: Text to extract terms from
 
         Returns:
-            Dictionary mapping categories to sets of glob patterns
+            Set of normalized terms
         """
-        from dope.core.pattern_utils import extract_file_paths_from_text, normalize_code_path
-
-        patterns_by_category: dict[str, set[str]] = defaultdict(set)
+        with self._terms_cache_lock:
+            cached = self._terms_cache.get(text)
+        if cached is not None:
+            return cached
+
+        cached = frozenset(self._extract_terms(text))
+        with self._terms_cache_lock:
+            if len(self._terms_cache) >= _TERMS_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del self._terms_cache[next(iter(self._terms_cache))]
+            self._terms_cache[text] = cached
+        return cached
+
+    def _extract_code_patterns(self, text: str) -> set[str]:
+        """Extract code patterns from documentation text.
 
-        # Extract file paths from text
-        file_paths = extract_file_paths_from_text(text)
+        Identifies file paths in references and generates normalized glob patterns.
 
-        if not file_paths:
-            return patterns_by_category
+        Args:
+            text: Reference text that may contain file paths
 
-        # Infer category from section name
-        category = self._infer_category_from_section(section_name)
+        Returns:
+            Set of glob patterns for the file paths found
+        """
+        patterns: set[str] = set()
 
-        # Generate patterns for each file path
-        for file_path in file_paths:
-            normalized = normalize_code_path(file_path)
-            patterns_by_category[category].update(normalized)
+        # Generate patterns for each file path in the text
+        for file_path in extract_file_paths_from_text(text):
+            patterns.update(normalize_code_path(file_path))
 
-        return patterns_by_category
+        return patterns
 
     def _infer_category_from_section(self, section_name: str) -> str:
         """Infer change category from section name.
@@ -174,32 +424,14 @@ class DocTermIndex:
         Returns:
             Category string (api, cli, config, architecture, etc.)
         """
-        section_lower = section_name.lower()
-
-        # Category keywords (order matters - check specific before general)
-        category_keywords = {
-            "cli": ["command", "cli", "arguments", "flags", "option"],
-            "api": ["api", "endpoint", "route", "rest", "graphql", "http"],
-            "config": ["config", "setting", "environment", "option"],
-            "architecture": ["architecture", "design", "structure", "pattern"],
-            "testing": ["test", "testing", "pytest", "unittest"],
-            "documentation": ["document", "readme", "guide", "tutorial"],
-            "dependencies": ["dependency", "package", "requirement", "install"],
-            "performance": ["performance", "optimization", "speed", "benchmark"],
-            "security": ["security", "auth", "permission", "credential"],
-        }
-
-        # Check for keyword matches
-        for category, keywords in category_keywords.items():
-            if any(keyword in section_lower for keyword in keywords):
-                return category
-
-        # Default to general if no match
-        return "general"
+        return _infer_section_category(section_name)
 
     def get_relevant_docs(self, code_diff: str) -> list[tuple[str, int]]:
         """Find docs that mention terms appearing in code diff.
 
+        For git diff output only the headers and added/removed lines are tokenized;
+        unchanged context lines would otherwise dominate the match counts.
+
         Args:
             code_diff: Git diff output to analyze
 
@@ -209,38 +441,75 @@ class DocTermIndex:
         if not code_diff or not self.term_to_docs:
             return []
 
-        # Extract terms from diff
+        # Extract terms from diff, ignoring unchanged context lines of git diff output
+        if code_diff.startswith("diff --git"):
+            code_diff = "\n".join(
+                line for line in code_diff.splitlines() if not line.startswith(" ")
+            )
         diff_terms = self._extract_terms(code_diff)
 
-        # Count matches per doc
-        doc_matches: dict[str, int] = defaultdict(int)
-        for term in diff_terms:
-            if term in self.term_to_docs:
-                for doc_path in self.term_to_docs[term]:
-                    doc_matches[doc_path] += 1
-
-        # Sort by match count (most relevant first)
-        sorted_matches = sorted(doc_matches.items(), key=lambda x: x[1], reverse=True)
-
-        return sorted_matches
+        # Count matches per doc; most_common() returns them most relevant first
+        term_to_docs = self.term_to_docs
+        doc_matches = Counter(
+            chain.from_iterable(term_to_docs[term] for term in diff_terms if term in term_to_docs)
+        )
+        return doc_matches.most_common()
 
     def save(self) -> None:
         """Save term index to JSON file."""
         if not self.index_path:
             return
 
+        # Store each doc path once and refer to it by index in the posting lists
+        doc_ids: dict[str, int] = {}
+        postings = {
+            term: [doc_ids.setdefault(doc, len(doc_ids)) for doc in docs]
+            for term, docs in self.term_to_docs.items()
+        }
+
         # Convert sets to lists for JSON serialization
         serializable_index = {
-            "term_to_docs": {term: list(docs) for term, docs in self.term_to_docs.items()},
+            "doc_paths": list(doc_ids),
+            "term_to_docs": postings,
             "doc_hashes": self.doc_hashes,
             "code_patterns": {
                 category: list(patterns) for category, patterns in self.code_patterns.items()
             },
         }
+        if self._doc_patterns is not None:
+            serializable_index["doc_patterns"] = {
+                doc_path: {
+                    category: list(pattern_set) for category, pattern_set in by_category.items()
+                }
+                for doc_path, by_category in self._doc_patterns.items()
+            }
 
+        # Encode in one dumps() call (json.dump streams through the slower iterencode path)
         self.index_path.parent.mkdir(parents=True, exist_ok=True)
-        with self.index_path.open("w") as f:
-            json.dump(serializable_index, f, indent=2)
+        self.index_path.write_bytes(
+            json.dumps(serializable_index, separators=(",", ":")).encode("utf-8")
+        )
+        # Doc hashes alone, so freshness can be checked without parsing the postings
+        _hashes_path(self.index_path).write_bytes(
+            json.dumps(self.doc_hashes, separators=(",", ":")).encode("utf-8")
+        )
+
+    def load_hashes(self) -> bool:
+        """Load only the doc hashes saved alongside the index.
+
+        Enough for is_stale(); term_to_docs and code_patterns are left untouched.
+
+        Returns:
+            True if loaded successfully, False if the index or its hashes file is missing
+        """
+        if not self.index_path or not self.index_path.exists():
+            return False
+
+        try:
+            self.doc_hashes = json.loads(_hashes_path(self.index_path).read_bytes())
+            return True
+        except (FileNotFoundError, json.JSONDecodeError):
+            return False
 
     def load(self) -> bool:
         """Load term index from JSON file.
@@ -252,23 +521,43 @@ class DocTermIndex:
             return False
 
         try:
-            with self.index_path.open("r") as f:
-                data = json.load(f)
-
-            # Convert lists back to sets
-            self.term_to_docs = defaultdict(
-                set, {term: set(docs) for term, docs in data.get("term_to_docs", {}).items()}
-            )
-            self.doc_hashes = data.get("doc_hashes", {})
+            data = json.loads(self.index_path.read_bytes())
+
+            # Convert lists back to sets, popping each raw section so it can be freed as
+            # soon as it is converted rather than living alongside every converted copy
+            postings = data.pop("term_to_docs", {})
+            doc_paths = data.pop("doc_paths", None)
+            if doc_paths is not None:
+                doc_paths = [sys.intern(doc_path) for doc_path in doc_paths]
+                self.term_to_docs = {
+                    term: frozenset(doc_paths[doc_id] for doc_id in doc_ids)
+                    for term, doc_ids in postings.items()
+                }
+            else:
+                self.term_to_docs = _freeze_postings(postings)
+            del postings
+            self.doc_hashes = data.pop("doc_hashes", {})
             self.code_patterns = defaultdict(
                 set,
                 {
                     category: set(patterns)
-                    for category, patterns in data.get("code_patterns", {}).items()
+                    for category, patterns in data.pop("code_patterns", {}).items()
                 },
             )
+            doc_patterns = data.pop("doc_patterns", None)
+            self._doc_patterns = (
+                {
+                    doc_path: {
+                        category: set(patterns) for category, patterns in by_category.items()
+                    }
+                    for doc_path, by_category in doc_patterns.items()
+                }
+                if doc_patterns is not None
+                else None
+            )
+            self._doc_terms = None
             return True
-        except (json.JSONDecodeError, KeyError):
+        except (json.JSONDecodeError, KeyError, IndexError):
             return False
 
     def is_stale(self, doc_state: dict) -> bool:
@@ -278,23 +567,22 @@ class DocTermIndex:
             doc_state: Current documentation state
 
         Returns:
-            True if any doc hashes have changed
+            True if any indexable doc was changed, added or removed
         """
         if not self.doc_hashes:
             return True
 
-        for doc_path, doc_data in doc_state.items():
-            # Skip files without summaries (same as build_from_state)
-            if not doc_data.get("summary") or doc_data.get("skipped"):
-                continue
-
-            current_hash = doc_data.get("hash", "")
-            cached_hash = self.doc_hashes.get(doc_path, "")
-
-            if current_hash != cached_hash:
+        # Any indexed doc that changed, vanished or lost its summary
+        for doc_path, cached_hash in self.doc_hashes.items():
+            doc_data = doc_state.get(doc_path)
+            if doc_data is None or not _is_indexable(doc_data):
+                return True
+            if doc_data.get("hash", "") != cached_hash:
                 return True
 
-        return False
+        # Every indexed doc is still current, so any extra indexable doc is a new one
+        indexable = sum(1 for doc_data in doc_state.values() if _is_indexable(doc_data))
+        return indexable != len(self.doc_hashes)
 
     def filter_relevant_docs(  # pylint: disable=too-many-locals,too-many-branches
         self,
@@ -349,14 +637,13 @@ class DocTermIndex:
                 elif isinstance(summary, str):
                     all_code_terms.update(self._extract_terms(summary))
 
-        # Score each doc based on term matches
-        doc_scores: dict[str, int] = {}
-        for doc_path in doc_state:
-            match_count = 0
-            for term in all_code_terms:
-                if term in self.term_to_docs and doc_path in self.term_to_docs[term]:
-                    match_count += 1
-            doc_scores[doc_path] = match_count
+        # Score each doc based on term matches by walking the posting lists of the code terms
+        term_to_docs = self.term_to_docs
+        doc_scores = Counter(
+            chain.from_iterable(
+                term_to_docs[term] for term in all_code_terms if term in term_to_docs
+            )
+        )
 
         # Filter docs using conservative approach
         filtered_docs = {}
@@ -379,17 +666,26 @@ class DocTermIndex:
                 include = True
 
             if include:
-                # Add term relevance metadata
-                doc_data_copy = dict(doc_data)
-                doc_data_copy["term_relevance"] = {
-                    "match_count": match_count,
-                    "matched_terms": match_count > 0,
+                # Add term relevance metadata on a shallow copy; doc_state is persisted
+                # state, so the caller's entries must not be stamped
+                filtered_docs[doc_path] = {
+                    **doc_data,
+                    "term_relevance": {
+                        "match_count": match_count,
+                        "matched_terms": match_count > 0,
+                    },
                 }
-                filtered_docs[doc_path] = doc_data_copy
 
         return filtered_docs
 
 
+def _index_doc_worker(
+    doc_data: dict, extract_patterns: bool
+) -> tuple[set[str], dict[str, set[str]]]:
+    """Index one doc in a worker process (module-level so it can be pickled)."""
+    return DocTermIndex()._index_doc(doc_data, extract_patterns)
+
+
 class DocTermIndexBuilder:
     """Builder for creating and updating DocTermIndex from documentation state.
 
@@ -423,12 +719,20 @@ class DocTermIndexBuilder:
         """
         index = DocTermIndex(self._index_path)
 
-        # Check if we can use cached index
-        if index.load() and not index.is_stale(doc_state):
+        # Check freshness from the saved doc hashes before parsing the whole index
+        if index.load_hashes() and not index.is_stale(doc_state):
             return False
 
-        # Build and save
-        index.build_from_state(doc_state, extract_patterns=self._extract_patterns)
+        loaded = index.load()
+        if loaded and not index.is_stale(doc_state):
+            # Index saved without a hashes file; reuse it as-is
+            return False
+
+        # Re-index only changed docs when a cached index exists
+        if loaded:
+            index.update_from_state(doc_state, extract_patterns=self._extract_patterns)
+        else:
+            index.build_from_state(doc_state, extract_patterns=self._extract_patterns)
         index.save()
         return True
 
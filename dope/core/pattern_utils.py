@@ -5,10 +5,18 @@ and pattern deduplication for scope-based filtering.
 """
 
 import re
+from functools import lru_cache
 from pathlib import Path
 
+# Path-like strings with at least one slash and optional extension
+# Matches: dope/cli/main.py, src/api/routes, ./scripts/build.sh
+# Segment runs are possessive: their class excludes "/" and ".", so giving characters
+# back can never produce a match and only costs backtracking on long tokens.
+_PATH_RE = re.compile(r"\.?/?(?:[a-zA-Z0-9_\-]++/)+[a-zA-Z0-9_\-]++(?:\.[a-zA-Z0-9]+)?")
 
-def normalize_code_path(file_path: str) -> list[str]:
+
+@lru_cache(maxsize=4096)
+def normalize_code_path(file_path: str) -> tuple[str, ...]:
     """Generate glob pattern variants from a concrete file path.
 
     Creates multiple levels of generalization to match similar files:
@@ -16,20 +24,22 @@ def normalize_code_path(file_path: str) -> list[str]:
     - Deep component: Matches nested paths (e.g., **/cli/**)
     - Rooted pattern: Maintains path structure (e.g., dope/cli/*)
 
+    Results are cached per path since the same paths recur across doc references.
+
     Args:
         file_path: Concrete file path (e.g., "dope/cli/main.py")
 
     Returns:
-        List of glob patterns in order of specificity (most specific first)
+        Tuple of glob patterns in order of specificity (most specific first)
 
     Example:
         >>> normalize_code_path("dope/cli/main.py")
-        ['dope/cli/*', '*/cli/*', '**/cli/**']
-        >>> normalize_code_path("src/api/routes/users.py")
-        ['src/api/routes/*', '*/routes/*', '**/routes/**', 'src/api/*', '*/api/*', '**/api/**']
+        ('*/cli/*', '**/cli/**', 'dope/*', '*/dope/*', '**/dope/**')
+        >>> normalize_code_path("src/api/users.py")
+        ('*/api/*', '**/api/**', 'src/*', '*/src/*', '**/src/**')
     """
     if not file_path:
-        return []
+        return ()
 
     patterns: list[str] = []
     path = Path(file_path)
@@ -38,7 +48,7 @@ def normalize_code_path(file_path: str) -> list[str]:
     parts = list(path.parent.parts) if path.parent != Path(".") else []
 
     if not parts:
-        return []
+        return ()
 
     # Skip common noise directories
     noise_parts = {"__pycache__", "node_modules", ".git", "dist", "build"}
@@ -65,14 +75,7 @@ def normalize_code_path(file_path: str) -> list[str]:
         patterns.append(deep)
 
     # Deduplicate while preserving order
-    seen = set()
-    unique_patterns = []
-    for pattern in patterns:
-        if pattern not in seen:
-            seen.add(pattern)
-            unique_patterns.append(pattern)
-
-    return unique_patterns
+    return tuple(dict.fromkeys(patterns))
 
 
 def merge_patterns(
@@ -134,16 +137,13 @@ def extract_file_paths_from_text(text: str) -> list[str]:
         >>> extract_file_paths_from_text("Run `./src/server.js` to start")
         ['src/server.js']
     """
-    if not text:
+    # Every path has at least one slash, so slash-free text cannot match
+    if not text or "/" not in text:
         return []
 
     paths = []
 
-    # Pattern: path-like strings with at least one slash and optional extension
-    # Matches: dope/cli/main.py, src/api/routes, ./scripts/build.sh
-    path_pattern = r"\.?/?(?:[a-zA-Z0-9_\-]+/)+[a-zA-Z0-9_\-]+(?:\.[a-zA-Z0-9]+)?"
-
-    matches = re.findall(path_pattern, text)
+    matches = _PATH_RE.findall(text)
 
     for match in matches:
         # Clean up match
@@ -45,11 +45,6 @@ def format_file_content(
         >>> format_file_content("config.py", "DEBUG=True", priority="HIGH")
         'file_path: config.py\npriority: HIGH\n\n<Content>\nDEBUG=True\n</Content>'
     """
-    parts = [f"file_path: {file_path}"]
-
-    for key, value in metadata.items():
-        parts.append(f"{key}: {value}")
-
-    parts.append(f"\n<{tag_name}>\n{content}\n</{tag_name}>")
-
-    return "\n".join(parts)
+    # Assemble in a single f-string so the (possibly large) content is copied only once
+    header = "".join(f"\n{key}: {value}" for key, value in metadata.items())
+    return f"file_path: {file_path}{header}\n\n<{tag_name}>\n{content}\n</{tag_name}>"
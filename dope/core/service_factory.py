@@ -112,14 +112,16 @@ class ServiceFactory:
 
         # Load scope if available
         scope = None
-        if self.settings.scope_path.exists():
-            try:
-                from dope.core.config_io import load_scope_from_yaml
-
-                scope = load_scope_from_yaml(self.settings.scope_path)
-            except Exception:
-                # Scope file exists but is invalid - continue without scope
-                pass
+        try:
+            from dope.core.config_io import load_scope_from_yaml
+
+            scope = load_scope_from_yaml(self.settings.scope_path)
+        except FileNotFoundError:
+            # No scope configured - continue without scope
+            pass
+        except Exception:
+            # Scope file exists but is invalid - continue without scope
+            pass
 
         return DocChangeSuggester(
             repository=repository,
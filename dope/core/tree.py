@@ -21,19 +21,20 @@ def build_tree(paths: list[Path], base_dir: Path = Path(".")) -> Node:
         >>> root.name
         '.'
     """
-    nodes: dict[str, Node] = {}
+    # Nodes keyed by their parts relative to base_dir; walking down from the root
+    # avoids building a Path and its parent for every component of every file
     root = Node(base_dir.name)
-    nodes[str(base_dir)] = root
+    nodes: dict[tuple[str, ...], Node] = {(): root}
 
     for path in paths:
-        parts = path.relative_to(base_dir).parts
-        current_path = base_dir
-        for part in parts:
-            current_path = current_path / part
-            key = str(current_path)
-            if key not in nodes:
-                parent_key = str(current_path.parent)
-                nodes[key] = Node(part, parent=nodes[parent_key])
+        parent = root
+        key: tuple[str, ...] = ()
+        for part in path.relative_to(base_dir).parts:
+            key += (part,)
+            node = nodes.get(key)
+            if node is None:
+                node = nodes[key] = Node(part, parent=parent)
+            parent = node
     return root
 
 
@@ -4,8 +4,10 @@ This module implements the Strategy pattern to compose different scanning
 and description behaviors without inheritance.
 """
 
+import hashlib
 import logging
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Protocol
@@ -25,11 +27,14 @@ from dope.services.describer.describer_agents import (
 from dope.services.describer.prompts import SUMMARIZATION_TEMPLATE
 
 if TYPE_CHECKING:
-    from dope.consumers.git_consumer import GitConsumer
+    from dope.consumers.git_consumer import DiffStat, GitConsumer
 
 
 logger = logging.getLogger(__name__)
 
+# Worker threads used to overlap per-file git subprocesses during a code scan
+_SCAN_WORKERS = 8
+
 
 class ScanStrategy(Protocol):
     """Protocol for file scanning strategies.
@@ -99,8 +104,6 @@ class DocScanStrategy:
         Returns:
             Dict mapping file paths to hash metadata.
         """
-        import hashlib
-
         file_hashes = {}
         for file_path in consumer.discover_files():
             content = consumer.get_content(file_path)
@@ -128,6 +131,7 @@ class CodeScanStrategy:
     enable_filtering: bool = True
     doc_term_index_path: Path | None = None
     _doc_term_index: object | None = None
+    _diff_stats: "dict[str, DiffStat] | None" = None
 
     def __post_init__(self):
         """Initialize classifier and load doc term index."""
@@ -157,50 +161,31 @@ class CodeScanStrategy:
         Returns:
             ChangeMagnitude with detailed change metrics.
         """
-        import re
-
-        repo = self.consumer.repo
-        base_branch = self.consumer.base_branch
-
-        # Get diff with rename detection
-        diff_output = repo.git.diff(
-            base_branch,
-            "-M90%",  # Detect renames with 90% similarity threshold
-            "--numstat",  # Get line counts
-            "--",
-            str(file_path),
-        )
+        path_key = Path(file_path).as_posix()
+        if self._diff_stats is not None:
+            # Batched stats primed by scan_files; files absent from them are unchanged
+            stats = self._diff_stats
+        else:
+            stats = self.consumer.get_diff_stats(paths=[file_path])
+
+        lines_added, lines_deleted, rename_similarity = stats.get(path_key, (0, 0, None))
+        return self._build_magnitude(lines_added, lines_deleted, rename_similarity)
+
+    @staticmethod
+    def _build_magnitude(
+        lines_added: int, lines_deleted: int, rename_similarity: int | None
+    ) -> ChangeMagnitude:
+        """Assemble a scored ChangeMagnitude from raw diff stats.
 
-        # Parse numstat output: "added\tdeleted\tfilename"
-        lines_added = 0
-        lines_deleted = 0
-        is_rename = False
-        rename_similarity = None
-
-        if diff_output:
-            lines = diff_output.strip().split("\n")
-            if lines:
-                parts = lines[0].split("\t")
-                if len(parts) >= 2:
-                    # Handle binary files (marked as '-')
-                    added_str = parts[0]
-                    deleted_str = parts[1]
-
-                    lines_added = 0 if added_str == "-" else int(added_str)
-                    lines_deleted = 0 if deleted_str == "-" else int(deleted_str)
-
-        # Check for rename/move
-        rename_output = repo.git.diff(base_branch, "-M90%", "--summary", "--", str(file_path))
-
-        if "rename" in rename_output.lower():
-            is_rename = True
-            # Try to extract similarity percentage
-            match = re.search(r"(\d+)%", rename_output)
-            if match:
-                rename_similarity = int(match.group(1))
-
-        # Calculate significance score using shared function
-        total_lines = lines_added + lines_deleted
+        Args:
+            lines_added: Number of lines added.
+            lines_deleted: Number of lines deleted.
+            rename_similarity: Rename similarity percentage, or None if not a rename.
+
+        Returns:
+            ChangeMagnitude with detailed change metrics.
+        """
+        is_rename = rename_similarity is not None
         score = calculate_magnitude_score(
             lines_added=lines_added,
             lines_deleted=lines_deleted,
@@ -211,7 +196,7 @@ class CodeScanStrategy:
         return ChangeMagnitude(
             lines_added=lines_added,
             lines_deleted=lines_deleted,
-            total_lines=total_lines,
+            total_lines=lines_added + lines_deleted,
             is_rename=is_rename,
             rename_similarity=rename_similarity,
             score=score,
@@ -362,40 +347,55 @@ class CodeScanStrategy:
         Returns:
             Dict mapping file paths to metadata.
         """
-        import hashlib
-
-        file_hashes = {}
         discovered_files = self.consumer.discover_files()
+        if self.enable_filtering:
+            # One whole-tree diff replaces per-file numstat calls during the scan
+            try:
+                self._diff_stats = self.consumer.get_diff_stats()
+            except Exception as e:
+                logger.warning("Could not batch diff stats: %s. Diffing per file.", e)
 
-        for file_path in discovered_files:
-            if self.enable_filtering:
-                decision = self.should_process_file(file_path)
-
-                if not decision["process"]:
-                    # Record skipped files in state for debugging/metrics
-                    file_hashes[str(file_path)] = {
-                        "hash": None,
-                        "skipped": True,
-                        "skip_reason": decision["reason"],
-                        "metadata": decision.get("metadata", {}),
-                    }
-                    continue
-
-                # Store decision metadata for later use
-                content = self.consumer.get_content(file_path)
-                file_hash = hashlib.md5(content).hexdigest()
-                file_hashes[str(file_path)] = {
-                    "hash": file_hash,
-                    "priority": decision.get("priority"),
-                    "metadata": decision.get("metadata", {}),
+        try:
+            # Each file still costs a few git subprocesses; overlap them across threads
+            with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as pool:
+                entries = pool.map(self._scan_file, discovered_files)
+                return {
+                    str(file_path): entry
+                    for file_path, entry in zip(discovered_files, entries, strict=True)
                 }
-            else:
-                # Original behavior when filtering is disabled
-                content = self.consumer.get_content(file_path)
-                file_hash = hashlib.md5(content).hexdigest()
-                file_hashes[str(file_path)] = {"hash": file_hash}
+        finally:
+            self._diff_stats = None
 
-        return file_hashes
+    def _scan_file(self, file_path: Path) -> dict:
+        """Build the state entry for one discovered file.
+
+        Args:
+            file_path: Path of the changed file.
+
+        Returns:
+            State entry with hash, or skip details when filtered out.
+        """
+        if not self.enable_filtering:
+            # Original behavior when filtering is disabled
+            return {"hash": hashlib.md5(self.consumer.get_content(file_path)).hexdigest()}
+
+        decision = self.should_process_file(file_path)
+        if not decision["process"]:
+            # Record skipped files in state for debugging/metrics
+            return {
+                "hash": None,
+                "skipped": True,
+                "skip_reason": decision["reason"],
+                "metadata": decision.get("metadata", {}),
+            }
+
+        # Store decision metadata for later use
+        content = self.consumer.get_content(file_path)
+        return {
+            "hash": hashlib.md5(content).hexdigest(),
+            "priority": decision.get("priority"),
+            "metadata": decision.get("metadata", {}),
+        }
 
 
 @dataclass
@@ -106,7 +106,7 @@ class ScopeService:
         {code_structure}
 
         Here is the scope:
-        {scope.model_dump_json(indent=2)}
+        {scope.model_dump_json()}
 
         Here are the document keys to be filled into the dict {scope.get_all_documents()}:
 
@@ -143,6 +143,7 @@ class ScopeService:
 
     def _modify_or_create_doc(self, scope: ScopeTemplate):
         changes_to_other_files: list[SuggestedChange] = []
+        scope_json = scope.model_dump_json()
         for _, doc in track(
             scope.documentation_structure.items(),
             description="Aligning changes to current doc structure",
@@ -151,7 +152,7 @@ class ScopeService:
                 Path(doc.implemented_in_path) if doc.implemented_in_path else Path(".")
             )
             prompt = CHANGE_FILE_PROMPT.format(
-                scope=scope.model_dump_json(indent=2),
+                scope=scope_json,
                 filepath=str(doc.implemented_in_path),
                 file_content=content,
             )
@@ -279,7 +279,7 @@ class ScopeAlignmentFilter:
             return 0
 
         # Extract terms from code content
-        code_terms = self._doc_term_index._extract_terms(code_content)
+        code_terms = self._doc_term_index._extract_terms_cached(code_content)
 
         # Count matches with doc terms
         match_count = 0
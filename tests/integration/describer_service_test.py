@@ -10,6 +10,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from dope.consumers.git_consumer import DiffStat
 from dope.core.classification import FileClassification, FileClassifier
 from dope.repositories.describer_state import DescriberRepository
 from dope.services.describer.describer_base import CodeDescriberService, DescriberService
@@ -161,8 +162,8 @@ class TestCodeDescriberServiceFiltering:
         mock_classifier.classify.return_value = FileClassification(
             classification="HIGH", reason="Entry point", matched_pattern="__init__.py"
         )
-        # Mock git operations
-        mock_git_consumer.repo.git.diff.return_value = "5\t0\t__init__.py"
+        # Mock git diff stats
+        mock_git_consumer.get_diff_stats.return_value = {"__init__.py": DiffStat(5, 0)}
         mock_git_consumer.get_normalized_diff.return_value = b"diff content"
 
         result = service.should_process_file(Path("__init__.py"))
@@ -175,11 +176,10 @@ class TestCodeDescriberServiceFiltering:
         mock_classifier.classify.return_value = FileClassification(
             classification="NORMAL", reason="Regular file"
         )
-        # Mock git operations for pure rename
-        mock_git_consumer.repo.git.diff.side_effect = [
-            "0\t0\trenamed_file.py",  # numstat
-            "rename old_file.py => renamed_file.py (98%)",  # summary
-        ]
+        # Mock git diff stats for pure rename
+        mock_git_consumer.get_diff_stats.return_value = {
+            "renamed_file.py": DiffStat(0, 0, rename_similarity=98)
+        }
         mock_git_consumer.get_normalized_diff.return_value = b""
 
         result = service.should_process_file(Path("renamed_file.py"))
@@ -203,11 +203,8 @@ class TestCodeDescriberServiceFiltering:
 
         mock_classifier.classify.side_effect = classify_side_effect
 
-        # Mock git operations for normal file
-        mock_git_consumer.repo.git.diff.side_effect = [
-            "50\t20\tsrc/main.py",  # numstat
-            "",  # summary
-        ]
+        # Batched diff stats for normal file
+        mock_git_consumer.get_diff_stats.return_value = {"src/main.py": DiffStat(50, 20)}
         mock_git_consumer.get_normalized_diff.return_value = b"diff content"
         mock_git_consumer.get_content.return_value = b"content"
 
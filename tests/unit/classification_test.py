@@ -5,10 +5,12 @@ from pathlib import Path
 import pytest
 
 from dope.core.classification import (
+    ChangeCategory,
     ChangeMagnitude,
     FileClassification,
     FileClassifier,
     calculate_magnitude_score,
+    infer_change_category,
 )
 
 
@@ -129,6 +131,20 @@ class TestCustomPatterns:
         assert classifier.classify(Path("file.important.py")).classification == "HIGH"
         assert classifier.classify(Path("CRITICAL.md")).classification == "HIGH"
 
+    def test_first_declared_pattern_wins(self):
+        """Test overlapping patterns resolve in declaration order with original casing."""
+        custom_trivial = {
+            "generated": ["*_Gen.py"],
+            "catch_all": ["*.py"],
+        }
+        classifier = FileClassifier(trivial_patterns=custom_trivial)
+
+        result = classifier.classify(Path("pkg/models_gen.py"))
+
+        assert result.reason == "Trivial file type: generated"
+        assert result.matched_pattern == "*_Gen.py"
+        assert classifier.classify(Path("pkg/other.py")).matched_pattern == "*.py"
+
 
 class TestCalculateMagnitudeScore:
     """Tests for calculate_magnitude_score function."""
@@ -250,3 +266,26 @@ class TestFileClassificationDataclass:
         )
 
         assert classification.matched_pattern is None
+
+
+class TestInferChangeCategory:
+    """Tests for infer_change_category function."""
+
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            ("dope/cli/main.py", ChangeCategory.CLI),
+            ("pyproject.toml", ChangeCategory.CONFIG),
+            ("docs/Guide.MD", ChangeCategory.DOCUMENTATION),
+            # Earlier categories win even when a later hint appears first in the path
+            ("tests/cli/main_test.py", ChangeCategory.CLI),
+            ("deploy/auth/service.py", ChangeCategory.SECURITY),
+        ],
+    )
+    def test_infers_category_by_priority(self, path, expected):
+        """Test the first matching category in priority order is returned."""
+        assert infer_change_category(Path(path)) is expected
+
+    def test_returns_none_without_hints(self):
+        """Test paths without any category hint return None."""
+        assert infer_change_category(Path("src/utils.py")) is None
@@ -5,7 +5,7 @@ from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
-from dope.consumers.git_consumer import GitConsumer
+from dope.consumers.git_consumer import DiffStat, GitConsumer
 from dope.core.classification import ChangeMagnitude, FileClassification, FileClassifier
 from dope.repositories.describer_state import DescriberRepository
 from dope.services.describer.describer_base import CodeDescriberService
@@ -83,8 +83,8 @@ class TestShouldProcessFile:
             classification="HIGH", reason="Critical file type: readme"
         )
 
-        # Mock git operations for change magnitude
-        mock_consumer.repo.git.diff.return_value = "2\t1\tREADME.md"
+        # Mock git diff stats for change magnitude
+        mock_consumer.get_diff_stats.return_value = {"README.md": DiffStat(2, 1)}
         mock_consumer.get_normalized_diff.return_value = b"some diff"
 
         decision = service.should_process_file(file_path)
@@ -100,11 +100,10 @@ class TestShouldProcessFile:
             classification="NORMAL", reason="Regular file"
         )
 
-        # Mock git operations - first call for numstat, second for summary
-        mock_consumer.repo.git.diff.side_effect = [
-            "0\t0\tnew_name.py",  # numstat
-            "rename old_name.py => new_name.py (98%)",  # summary
-        ]
+        # Mock git diff stats - rename with 98% similarity
+        mock_consumer.get_diff_stats.return_value = {
+            "new_name.py": DiffStat(0, 0, rename_similarity=98)
+        }
 
         decision = service.should_process_file(file_path)
 
@@ -122,10 +121,7 @@ class TestShouldProcessFile:
 
         # Mock git operations - small change (1 line total -> score 0.2 but trivial)
         # Need 0 lines for score 0.0 which is below 0.2 threshold
-        mock_consumer.repo.git.diff.side_effect = [
-            "0\t0\tutils.py",  # numstat - no actual changes
-            "",  # summary (no rename)
-        ]
+        mock_consumer.get_diff_stats.return_value = {"utils.py": DiffStat(0, 0)}
 
         decision = service.should_process_file(file_path)
 
@@ -141,10 +137,7 @@ class TestShouldProcessFile:
         )
 
         # Mock git operations - significant line count but whitespace only
-        mock_consumer.repo.git.diff.side_effect = [
-            "50\t20\tapi.py",  # numstat
-            "",  # summary (no rename)
-        ]
+        mock_consumer.get_diff_stats.return_value = {"api.py": DiffStat(50, 20)}
 
         # But normalized diff is empty (whitespace only)
         mock_consumer.get_normalized_diff.return_value = b""
@@ -165,10 +158,7 @@ class TestShouldProcessFile:
         )
 
         # Mock git operations - significant change
-        mock_consumer.repo.git.diff.side_effect = [
-            "50\t20\tcore/engine.py",  # numstat
-            "",  # summary (no rename)
-        ]
+        mock_consumer.get_diff_stats.return_value = {"core/engine.py": DiffStat(50, 20)}
 
         mock_consumer.get_normalized_diff.return_value = b"meaningful diff content"
 
@@ -209,10 +199,7 @@ class TestScanFiles:
         mock_classifier.classify.side_effect = classify_side_effect
 
         # Mock git operations for non-skipped file
-        mock_consumer.repo.git.diff.side_effect = [
-            "50\t20\tapi.py",  # numstat
-            "",  # summary
-        ]
+        mock_consumer.get_diff_stats.return_value = {"api.py": DiffStat(50, 20)}
 
         mock_consumer.get_normalized_diff.return_value = b"meaningful diff"
         mock_consumer.get_content.return_value = b"file content"
@@ -340,10 +327,7 @@ class TestIntegration:
         mock_classifier.classify.side_effect = classify_side_effect
 
         # Mock git operations
-        mock_consumer.repo.git.diff.side_effect = [
-            "50\t20\tapi.py",  # numstat
-            "",  # summary
-        ]
+        mock_consumer.get_diff_stats.return_value = {"api.py": DiffStat(50, 20)}
         mock_consumer.get_normalized_diff.return_value = b"meaningful diff"
         mock_consumer.get_content.return_value = b"file content"
 
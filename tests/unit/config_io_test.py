@@ -8,6 +8,7 @@ import yaml
 from dope.core.config_io import (
     generate_local_cache,
     generate_local_config_file,
+    load_scope_from_yaml,
     load_settings_from_yaml,
 )
 from dope.models.settings import Settings
@@ -49,6 +50,14 @@ def test_load_settings_from_yaml_invalid_syntax(temp_file):
         load_settings_from_yaml(config_path)
 
 
+def test_load_scope_from_yaml_missing_file(temp_dir):
+    """Test loading a missing scope file raises FileNotFoundError with context."""
+    scope_path = temp_dir / "scope.yaml"
+
+    with pytest.raises(FileNotFoundError, match="Scope file not found"):
+        load_scope_from_yaml(scope_path)
+
+
 def test_generate_local_config_file(temp_dir, monkeypatch):
     """Test generating a local config file."""
     monkeypatch.chdir(temp_dir)
@@ -4,7 +4,12 @@ from pathlib import Path
 
 import pytest
 
-from dope.core.config_locator import find_project_root, locate_local_config_file
+from dope.core import config_locator
+from dope.core.config_locator import (
+    find_project_root,
+    locate_global_config,
+    locate_local_config_file,
+)
 
 
 def test_find_project_root_in_git_repo(git_repo):
@@ -84,3 +89,33 @@ def test_locate_local_config_file_stops_at_project_root(git_repo, monkeypatch):
     result = locate_local_config_file("dope.yaml")
 
     assert result is None
+
+
+def test_find_project_root_opens_repo_once_per_directory(git_repo, monkeypatch):
+    """Test repeated lookups from the same directory reuse the cached root."""
+    repo_path, _ = git_repo
+    opened = []
+    real_repo = config_locator.Repo
+
+    def counting_repo(*args, **kwargs):
+        opened.append(args)
+        return real_repo(*args, **kwargs)
+
+    monkeypatch.setattr(config_locator, "Repo", counting_repo)
+    config_locator._find_git_root.cache_clear()
+
+    assert find_project_root(repo_path) == find_project_root(repo_path)
+    assert len(opened) == 1
+
+
+def test_locate_global_config_follows_config_home(tmp_path, monkeypatch):
+    """Test the user config directory is resolved on every call, not pinned per process."""
+    monkeypatch.setattr(config_locator, "user_config_dir", lambda app: str(tmp_path / "a" / app))
+    assert locate_global_config("config.yaml") is None
+
+    config_dir = tmp_path / "b" / config_locator.APP_NAME
+    config_dir.mkdir(parents=True)
+    (config_dir / "config.yaml").write_text("x: 1")
+    monkeypatch.setattr(config_locator, "user_config_dir", lambda app: str(tmp_path / "b" / app))
+
+    assert locate_global_config("config.yaml") == config_dir / "config.yaml"
@@ -1,10 +1,13 @@
 """Tests for documentation term indexing."""
 
+import json
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 
+from dope.core import doc_terms
 from dope.core.doc_terms import DocTermIndex, DocTermIndexBuilder
 
 
@@ -92,6 +95,21 @@ class TestTermExtraction:
         assert "auth" in terms
         assert "jwt" in terms
 
+    def test_extract_snake_case_path_components(self):
+        """Keep snake_case path components whole alongside their words."""
+        index = DocTermIndex()
+        terms = index._extract_terms("dope/core/doc_terms.py")
+
+        assert {"dope", "core", "doc_terms", "doc", "terms"} <= terms
+
+    def test_extract_digit_joined_words(self):
+        """Split lowercase words joined by digits."""
+        index = DocTermIndex()
+
+        assert index._extract_terms("oauth2client") == {"oauth2client", "oauth", "client"}
+        assert index._extract_terms("base64encode") == {"base64encode", "base", "encode"}
+        assert index._extract_terms("v2config") == {"v2config", "config"}
+
     def test_min_length_filtering(self):
         """Only extract terms with 3+ characters."""
         index = DocTermIndex()
@@ -109,6 +127,39 @@ class TestTermExtraction:
         assert "jwt" in terms
         assert "sessionmanager" in terms or "session" in terms
 
+    def test_extract_acronym_prefix(self):
+        """Split leading acronyms from PascalCase and keep the whole identifier."""
+        index = DocTermIndex()
+        terms = index._extract_terms("HTTPServer.start")
+
+        assert {"http", "server", "httpserver", "start"} <= terms
+
+    def test_extract_from_non_ascii_text(self):
+        """Accented words stay whole while punctuation still separates terms."""
+        index = DocTermIndex()
+        terms = index._extract_terms("café: naïve session_timeout")
+
+        assert {"café", "naïve", "session", "timeout"} <= terms
+        assert "caf" not in terms
+
+
+class TestCategoryInference:
+    """Test inferring change categories from section names."""
+
+    def test_first_declared_category_wins(self):
+        """Categories are checked in declaration order."""
+        index = DocTermIndex()
+
+        assert index._infer_category_from_section("REST API Security") == "api"
+        assert index._infer_category_from_section("Install Guide") == "documentation"
+
+    def test_unmatched_section_is_general(self):
+        """Sections without category keywords fall back to general."""
+        index = DocTermIndex()
+
+        assert index._infer_category_from_section("Overview") == "general"
+        assert index._infer_category_from_section("") == "general"
+
 
 class TestIndexBuilding:
     """Test building index from doc state."""
@@ -129,6 +180,46 @@ class TestIndexBuilding:
         assert "api" in index.term_to_docs
         assert "docs/api.md" in index.term_to_docs["api"]
 
+    def test_posting_lists_are_frozen(self, sample_doc_state):
+        """Posting lists are immutable once the index is built."""
+        index = DocTermIndex()
+        index.build_from_state(sample_doc_state)
+
+        assert all(isinstance(docs, frozenset) for docs in index.term_to_docs.values())
+
+    def test_parallel_build_matches_sequential(self, sample_doc_state, monkeypatch):
+        """Indexing docs in worker processes yields the same index."""
+        sequential = DocTermIndex()
+        sequential.build_from_state(sample_doc_state)
+
+        monkeypatch.setattr(doc_terms, "_PARALLEL_MIN_DOCS", 1)
+        monkeypatch.setattr(doc_terms, "_PARALLEL_MIN_DOCS_SPAWN", 1)
+        monkeypatch.setattr(doc_terms.os, "process_cpu_count", lambda: 2)
+        parallel = DocTermIndex()
+        parallel.build_from_state(sample_doc_state)
+
+        assert parallel.term_to_docs == sequential.term_to_docs
+        assert parallel.code_patterns == sequential.code_patterns
+
+    def test_spawned_workers_need_more_docs(self, monkeypatch):
+        """Start methods that re-import the app in each worker use the higher threshold."""
+        monkeypatch.setattr(doc_terms.multiprocessing, "get_start_method", lambda: "fork")
+        assert doc_terms._parallel_min_docs() == doc_terms._PARALLEL_MIN_DOCS
+
+        monkeypatch.setattr(doc_terms.multiprocessing, "get_start_method", lambda: "spawn")
+        assert doc_terms._parallel_min_docs() == doc_terms._PARALLEL_MIN_DOCS_SPAWN
+
+    def test_build_from_empty_state_resets_index(self, sample_doc_state):
+        """Rebuilding with no indexable docs leaves an empty index."""
+        index = DocTermIndex()
+        index.build_from_state(sample_doc_state)
+
+        index.build_from_state({"docs/skipped.md": {"hash": "x", "skipped": True}})
+
+        assert index.term_to_docs == {}
+        assert index.doc_hashes == {}
+        assert not index.code_patterns
+
     def test_skip_files_without_summary(self, sample_doc_state):
         """Don't index skipped files."""
         index = DocTermIndex()
@@ -222,6 +313,66 @@ class TestRelevanceMatching:
         matches = index.get_relevant_docs(diff)
         assert len(matches) == 0
 
+    def test_get_relevant_docs_ignores_context_lines(self, sample_doc_state):
+        """Only changed lines of git diff output count towards matches."""
+        index = DocTermIndex()
+        index.build_from_state(sample_doc_state)
+
+        diff = (
+            "diff --git a/app.py b/app.py\n"
+            "--- a/app.py\n"
+            "+++ b/app.py\n"
+            "@@ -1,3 +1,3 @@\n"
+            " import redis\n"
+            "-def create_post():\n"
+            "+def create_item():\n"
+        )
+
+        matches = dict(index.get_relevant_docs(diff))
+
+        assert "docs/api.md" in matches
+        assert "docs/authentication.md" not in matches
+
+    def test_repeated_text_is_tokenized_once(self, monkeypatch):
+        """Tokenizing the same text again reuses its extracted terms."""
+        index = DocTermIndex()
+        calls = []
+        extract = index._extract_terms
+
+        def counting_extract(text):
+            calls.append(text)
+            return extract(text)
+
+        monkeypatch.setattr(index, "_extract_terms", counting_extract)
+
+        first = index._extract_terms_cached("+import jwt")
+        second = index._extract_terms_cached("+import jwt")
+
+        assert first == second
+        assert calls == ["+import jwt"]
+
+    def test_terms_cache_is_bounded(self, monkeypatch):
+        """Oldest cached texts are evicted once the cache is full."""
+        monkeypatch.setattr(doc_terms, "_TERMS_CACHE_SIZE", 2)
+        index = DocTermIndex()
+
+        for text in ("alpha", "beta", "gamma"):
+            index._extract_terms_cached(text)
+
+        assert list(index._terms_cache) == ["beta", "gamma"]
+
+    def test_terms_cache_is_thread_safe(self, monkeypatch):
+        """Concurrent lookups that evict entries neither fail nor lose terms."""
+        monkeypatch.setattr(doc_terms, "_TERMS_CACHE_SIZE", 4)
+        index = DocTermIndex()
+        texts = [f"session_timeout{i} handler" for i in range(200)]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(index._extract_terms_cached, texts * 4))
+
+        assert results == [frozenset(index._extract_terms(text)) for text in texts * 4]
+        assert len(index._terms_cache) <= 4
+
     def test_get_relevant_docs_empty_diff(self, sample_doc_state):
         """Handle empty diff gracefully."""
         index = DocTermIndex()
@@ -252,6 +403,36 @@ class TestCaching:
             assert len(index2.term_to_docs) == len(index1.term_to_docs)
             assert index2.doc_hashes == index1.doc_hashes
 
+    def test_save_stores_each_doc_path_once(self, sample_doc_state):
+        """Posting lists reference a doc path table and round-trip unchanged."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            index_path = Path(tmpdir) / "doc-terms.json"
+            index1 = DocTermIndex(index_path)
+            index1.build_from_state(sample_doc_state)
+            index1.save()
+
+            data = json.loads(index_path.read_text())
+            index2 = DocTermIndex(index_path)
+            index2.load()
+
+            assert sorted(data["doc_paths"]) == ["docs/api.md", "docs/authentication.md"]
+            assert all(
+                isinstance(doc_id, int) for ids in data["term_to_docs"].values() for doc_id in ids
+            )
+            assert index2.term_to_docs == index1.term_to_docs
+
+    def test_load_legacy_path_postings(self):
+        """Indexes saved with doc paths inline in posting lists still load."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            index_path = Path(tmpdir) / "doc-terms.json"
+            index_path.write_text(
+                json.dumps({"term_to_docs": {"jwt": ["docs/auth.md"]}, "doc_hashes": {}})
+            )
+            index = DocTermIndex(index_path)
+
+            assert index.load()
+            assert index.term_to_docs == {"jwt": frozenset({"docs/auth.md"})}
+
     def test_load_nonexistent_file(self):
         """Loading nonexistent file returns False."""
         index = DocTermIndex(Path("/nonexistent/path.json"))
@@ -300,9 +481,20 @@ class TestStaleness:
             "summary": {"sections": [{"section_name": "New", "references": ["new"]}]},
         }
 
-        # Current logic doesn't detect additions, only changes
-        # This is acceptable - index will just miss new terms until next rebuild
-        # Could enhance later if needed
+        assert index.is_stale(modified_state)
+
+    def test_is_stale_when_doc_removed(self, sample_doc_state):
+        """Index is stale if an indexed doc is gone or lost its summary."""
+        index = DocTermIndex()
+        index.build_from_state(sample_doc_state)
+
+        removed_state = dict(sample_doc_state)
+        del removed_state["docs/api.md"]
+        unsummarized_state = dict(sample_doc_state)
+        unsummarized_state["docs/api.md"] = {"hash": "def456", "summary": None}
+
+        assert index.is_stale(removed_state)
+        assert index.is_stale(unsummarized_state)
 
     def test_is_stale_with_empty_cache(self, sample_doc_state):
         """Empty index is always stale."""
@@ -311,6 +503,51 @@ class TestStaleness:
         assert index.is_stale(sample_doc_state)
 
 
+class TestIncrementalUpdate:
+    """Test updating a loaded index with only the changed docs."""
+
+    def test_update_matches_full_build(self, sample_doc_state):
+        """Re-indexing changed docs yields the same index as a full rebuild."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            index_path = Path(tmpdir) / "doc-terms.json"
+            original = DocTermIndex(index_path)
+            original.build_from_state(sample_doc_state)
+            original.save()
+
+            sample_doc_state["docs/api.md"]["hash"] = "changed"
+            sample_doc_state["docs/api.md"]["summary"]["sections"][0]["references"] = [
+                "dope/cli/main.py",
+                "createPost",
+            ]
+            sample_doc_state["docs/new.md"] = {
+                "hash": "new123",
+                "summary": {"sections": [{"section_name": "Webhooks", "references": ["hook"]}]},
+            }
+
+            updated = DocTermIndex(index_path)
+            updated.load()
+            updated.update_from_state(sample_doc_state)
+            rebuilt = DocTermIndex()
+            rebuilt.build_from_state(sample_doc_state)
+
+            assert updated.term_to_docs == rebuilt.term_to_docs
+            assert updated.doc_hashes == rebuilt.doc_hashes
+            assert updated.code_patterns == rebuilt.code_patterns
+            assert "getuserbyid" not in updated.term_to_docs
+
+    def test_update_drops_removed_docs(self, sample_doc_state):
+        """Docs missing from the new state are removed from every posting list."""
+        index = DocTermIndex()
+        index.build_from_state(sample_doc_state)
+
+        del sample_doc_state["docs/authentication.md"]
+        index.update_from_state(sample_doc_state)
+
+        assert "docs/authentication.md" not in index.doc_hashes
+        assert "jwt" not in index.term_to_docs
+        assert all("docs/authentication.md" not in docs for docs in index.term_to_docs.values())
+
+
 class TestDocTermIndexBuilder:
     """Tests for DocTermIndexBuilder."""
 
@@ -339,6 +576,23 @@ class TestDocTermIndexBuilder:
 
             assert rebuilt is False
 
+    def test_build_if_needed_checks_hashes_without_loading_index(
+        self, sample_doc_state, monkeypatch
+    ):
+        """A fresh index is detected from the hashes file alone."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            index_path = Path(tmpdir) / "doc-terms.json"
+            builder = DocTermIndexBuilder(index_path)
+            builder.build_if_needed(sample_doc_state)
+
+            def fail_load(self):
+                raise AssertionError("full index should not be loaded")
+
+            monkeypatch.setattr(DocTermIndex, "load", fail_load)
+
+            assert (Path(tmpdir) / "doc-terms.hashes.json").exists()
+            assert builder.build_if_needed(sample_doc_state) is False
+
     def test_build_if_needed_rebuilds_when_stale(self, sample_doc_state):
         """Builder rebuilds index when stale."""
         with tempfile.TemporaryDirectory() as tmpdir:
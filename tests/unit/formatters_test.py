@@ -0,0 +1,72 @@
+"""Unit tests for CLI display formatters."""
+
+from pathlib import Path
+from types import SimpleNamespace
+
+from dope.cli.ui.console import console
+from dope.cli.ui.formatters import ConfigFormatter, StatusFormatter
+from dope.models.settings import AgentSettings, Settings
+
+
+def test_display_status_renders_table_next_steps_and_footer():
+    """Test status output contains the table, next steps and state directory."""
+    with console.capture() as capture:
+        StatusFormatter.display_status(
+            docs_scanned=2,
+            docs_summarized=1,
+            code_scanned=0,
+            code_summarized=0,
+            suggestions_count=0,
+            scope_exists=False,
+            state_directory=Path(".dope"),
+        )
+    output = capture.get()
+
+    assert "1/2 scanned and summarized" in output
+    assert "Not scanned yet" in output
+    assert "Next Steps:" in output
+    assert "dope scan code" in output
+    assert "dope suggest" in output
+    assert "State directory: .dope" in output
+
+
+def test_display_dry_run_preview_lists_changes():
+    """Test dry-run preview lists each change, a preview and the total."""
+    change = SimpleNamespace(
+        documentation_file_path="docs/guide.md",
+        change_type="change_existing",
+        suggested_changes=[SimpleNamespace(suggestion="Update installation steps")],
+    )
+
+    with console.capture() as capture:
+        StatusFormatter.display_dry_run_preview([change])
+    output = capture.get()
+
+    assert "docs/guide.md (change_existing)" in output
+    assert "- Update installation steps..." in output
+    assert "Total changes: 1" in output
+
+
+def test_display_json_and_yaml_hide_agent_token():
+    """Test both config serializers omit the agent token."""
+    settings = Settings(agent=AgentSettings(token="super-secret"))
+    with console.capture() as capture:
+        ConfigFormatter.display_json(settings)
+        ConfigFormatter.display_yaml(settings)
+    output = capture.get()
+
+    assert "super-secret" not in output
+    assert "token" not in output
+    assert "provider" in output
+
+
+def test_display_table_renders_settings_and_config_footer():
+    """Test the config table and config file footer are printed together."""
+    settings = Settings(agent=AgentSettings(token="super-secret"))
+    with console.capture() as capture:
+        ConfigFormatter.display_table(settings)
+    output = capture.get()
+
+    assert "DOPE Configuration" in output
+    assert "super-secret" not in output
+    assert "Config file:" in output
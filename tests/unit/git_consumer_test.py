@@ -6,11 +6,13 @@ since those methods were moved to dope.core.classification.FileClassifier.
 
 import tempfile
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 from git import Repo
 
-from dope.consumers.git_consumer import GitConsumer
+from dope.consumers import git_consumer
+from dope.consumers.git_consumer import DiffStat, GitConsumer
 
 
 @pytest.fixture(name="git_repo")
@@ -112,6 +114,61 @@ class TestGetContent:
         assert isinstance(normal_diff, bytes)
         assert isinstance(normalized_diff, bytes)
 
+    def test_repeated_diffs_run_git_once(self, git_repo):
+        """Test the same diff is served from the consumer cache on repeat calls."""
+        repo_path, repo = git_repo
+        consumer = GitConsumer(repo_path, "main")
+        (repo_path / "README.md").write_text("# Modified Project\n")
+        consumer.repo = MagicMock()
+        consumer.repo.git.diff.side_effect = repo.git.diff
+
+        first = consumer.get_normalized_diff(Path("README.md"))
+        second = consumer.get_normalized_diff(Path("README.md"))
+        content = consumer.get_content(Path("README.md"))
+        consumer.get_content(Path("README.md"))
+
+        assert first == second
+        assert b"Modified" in content
+        assert consumer.repo.git.diff.call_count == 2
+
+    def test_diff_cache_is_bounded(self, git_repo, monkeypatch):
+        """Test the oldest cached diffs are evicted once the cache is full."""
+        repo_path, _ = git_repo
+        consumer = GitConsumer(repo_path, "main")
+        monkeypatch.setattr(git_consumer, "_DIFF_CACHE_SIZE", 2)
+        consumer.repo = MagicMock()
+        consumer.repo.git.diff.return_value = "diff"
+
+        for name in ("a.py", "b.py", "c.py"):
+            consumer.get_normalized_diff(Path(name))
+
+        assert [path for path, _ in consumer._diff_cache] == ["b.py", "c.py"]
+
+
+class TestGetDiffStats:
+    """Test batched diff statistics."""
+
+    def test_get_diff_stats_counts_lines_and_detects_renames(self, git_repo):
+        """Test one whole-tree diff reports line counts and rename similarity."""
+        repo_path, repo = git_repo
+        module = repo_path / "old_name.py"
+        module.write_text("".join(f"line {i}\n" for i in range(30)))
+        repo.index.add([str(module)])
+        repo.index.commit("Add module")
+        repo.git.checkout("-b", "feature")
+        consumer = GitConsumer(repo_path, "main")
+
+        repo.git.mv("old_name.py", "new name.py")
+        (repo_path / "new name.py").write_text("".join(f"line {i}\n" for i in range(31)))
+        (repo_path / "README.md").write_text("# Test Project\nMore\n")
+
+        stats = consumer.get_diff_stats()
+
+        assert stats["README.md"] == DiffStat(1, 0)
+        assert stats["new name.py"].lines_added == 1
+        assert stats["new name.py"].rename_similarity >= 90
+        assert "old_name.py" not in stats
+
 
 class TestWhitespaceNormalization:
     """Test whitespace-normalized diffs."""
@@ -182,3 +239,17 @@ class TestGetMetadata:
         assert metadata.commits >= 1
         assert "main" in metadata.branches
         assert metadata.lines_of_code >= 0
+
+    def test_get_metadata_counts_lines_of_tracked_files(self, git_repo):
+        """Test LOC counts CRLF endings once and a final unterminated line."""
+        repo_path, repo = git_repo
+        source = repo_path / "app.py"
+        source.write_bytes(b"import os\r\nprint(os.name)\r\nprint('done')")
+        repo.index.add([str(source)])
+        repo.index.commit("Add app")
+        consumer = GitConsumer(repo_path, "main")
+
+        metadata = consumer.get_metadata()
+
+        # README.md has one line, app.py has three
+        assert metadata.lines_of_code == 4
@@ -0,0 +1,101 @@
+"""Unit tests for pattern_utils module - code path pattern helpers."""
+
+from dope.core import pattern_utils
+from dope.core.pattern_utils import (
+    extract_file_paths_from_text,
+    merge_patterns,
+    normalize_code_path,
+)
+
+
+class TestNormalizeCodePath:
+    """Test glob pattern generation from file paths."""
+
+    def test_docstring_examples(self):
+        """Patterns are ordered from most to least specific."""
+        assert normalize_code_path("dope/cli/main.py") == (
+            "*/cli/*",
+            "**/cli/**",
+            "dope/*",
+            "*/dope/*",
+            "**/dope/**",
+        )
+        assert normalize_code_path("src/api/users.py") == (
+            "*/api/*",
+            "**/api/**",
+            "src/*",
+            "*/src/*",
+            "**/src/**",
+        )
+
+    def test_returns_tuple(self):
+        """Results are immutable so cached values cannot be mutated by callers."""
+        assert isinstance(normalize_code_path("dope/cli/main.py"), tuple)
+        assert normalize_code_path("") == ()
+        assert normalize_code_path("main.py") == ()
+
+    def test_skips_noise_directories(self):
+        """Build and dependency directories produce no patterns."""
+        patterns = normalize_code_path("node_modules/lib/index.js")
+
+        assert "*/lib/*" in patterns
+        assert not any("node_modules" in pattern for pattern in patterns)
+
+    def test_results_are_cached(self):
+        """Repeated paths are served from the cache."""
+        normalize_code_path.cache_clear()
+
+        first = normalize_code_path("dope/core/doc_terms.py")
+        second = normalize_code_path("dope/core/doc_terms.py")
+
+        assert first is second
+        assert normalize_code_path.cache_info().hits == 1
+
+
+class TestMergePatterns:
+    """Test merging doc and scope patterns."""
+
+    def test_docstring_example(self):
+        """Duplicates are dropped and doc patterns come first."""
+        merged = merge_patterns(["*/cli/*", "dope/cli/*"], ["*/api/*", "*/cli/*"])
+
+        assert merged == ["*/cli/*", "dope/cli/*", "*/api/*"]
+
+    def test_scope_first(self):
+        """Scope patterns can be given priority instead."""
+        merged = merge_patterns(["*/cli/*"], ["*/api/*"], prioritize_doc=False)
+
+        assert merged == ["*/api/*", "*/cli/*"]
+
+
+class TestExtractFilePaths:
+    """Test file path extraction from documentation text."""
+
+    def test_docstring_examples(self):
+        """Paths are found in prose and inline code."""
+        assert extract_file_paths_from_text("See dope/cli/main.py for details") == [
+            "dope/cli/main.py"
+        ]
+        assert extract_file_paths_from_text("Run `./src/server.js` to start") == ["src/server.js"]
+
+    def test_text_without_slash(self):
+        """Slash-free text cannot contain a path."""
+        assert extract_file_paths_from_text("See main.py for details") == []
+        assert extract_file_paths_from_text("") == []
+
+    def test_skips_single_character_directories(self):
+        """Single-character directory names are treated as false positives."""
+        assert extract_file_paths_from_text("a/b.py and x/y/z.py") == []
+        assert extract_file_paths_from_text("src/a.py") == ["src/a.py"]
+
+    def test_path_regex_matches_directories_and_extensions(self):
+        """The path pattern accepts extension-less paths and leading ./ or /."""
+        assert pattern_utils._PATH_RE.findall("src/api/routes and ./scripts/build.sh") == [
+            "src/api/routes",
+            "./scripts/build.sh",
+        ]
+        assert pattern_utils._PATH_RE.fullmatch("/usr/local_bin/tool-v2")
+
+    def test_long_token_without_path(self):
+        """Long slash-containing tokens without path segments finish and match nothing."""
+        assert extract_file_paths_from_text("/" + "a" * 5000 + ".") == []
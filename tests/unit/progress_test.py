@@ -0,0 +1,80 @@
+"""Unit tests for CLI progress reporting."""
+
+import asyncio
+
+from dope.cli.ui.progress import ProgressReporter
+
+
+def test_track_iterable_yields_lazily():
+    """Test items are yielded before the source iterable is exhausted."""
+    consumed = []
+
+    def source():
+        for i in range(3):
+            consumed.append(i)
+            yield i
+
+    tracked = iter(ProgressReporter.track_iterable(source(), "Working"))
+
+    assert next(tracked) == 0
+    assert consumed == [0]
+    assert list(tracked) == [1, 2]
+
+
+def test_track_iterable_yields_all_list_items():
+    """Test list inputs are passed through unchanged."""
+    items = ["a", "b", "c"]
+
+    assert list(ProgressReporter.track_iterable(items, "Working")) == items
+
+
+def test_track_async_bounds_concurrency_and_swallows_failures():
+    """Test every item is processed, at most `concurrency` at a time."""
+    seen = []
+    running = 0
+    peak = 0
+
+    async def processor(item):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0)
+        running -= 1
+        seen.append(item)
+        if item == "bad":
+            raise ValueError(item)
+
+    items = ["a", "bad", "b", "c", "d", "e"]
+    asyncio.run(ProgressReporter.track_async(items, processor, "Working", concurrency=2))
+
+    assert sorted(seen) == sorted(items)
+    assert peak <= 2
+
+
+def test_create_async_scanner_describes_pending_files_only():
+    """Test scanner skips summarized/skipped files and saves updated state."""
+
+    class FakeScanner:
+        def __init__(self):
+            self.saved = None
+            self.described = []
+
+        def _load_state(self):
+            return {"done.py": {"summary": "x"}, "skip.py": {"skipped": True}}
+
+        def _save_state(self, state):
+            self.saved = state
+
+        async def describe_async(self, file_path, state_item):
+            self.described.append(file_path)
+            return {**state_item, "summary": f"summary of {file_path}"}
+
+    scanner = FakeScanner()
+    scan = ProgressReporter.create_async_scanner(
+        scanner, ["done.py", "skip.py", "new.py"], "Scanning", concurrency=2
+    )
+    asyncio.run(scan())
+
+    assert scanner.described == ["new.py"]
+    assert scanner.saved["new.py"] == {"summary": "summary of new.py"}
+    assert scanner.saved["done.py"] == {"summary": "x"}
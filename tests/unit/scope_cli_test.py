@@ -0,0 +1,57 @@
+"""Unit tests for scope command helpers."""
+
+from unittest.mock import MagicMock, patch
+
+from dope.cli.scope import _determine_project_size
+from dope.models.enums import ProjectTier
+
+
+def test_determine_project_size_auto_detection_returns_code_structure():
+    """Test auto-detection computes the code overview once and returns it."""
+    service = MagicMock()
+    service.get_code_overview.return_value = "tree"
+    service.get_complexity.return_value = ProjectTier.medium
+
+    with patch("dope.cli.scope.ProgressReporter"):
+        size, code_structure = _determine_project_size(False, None, service)
+
+    assert size == ProjectTier.medium
+    assert code_structure == "tree"
+    service.get_code_overview.assert_called_once()
+
+
+def test_determine_project_size_from_input_skips_code_overview():
+    """Test an explicit project size does not compute the code overview."""
+    service = MagicMock()
+
+    size, code_structure = _determine_project_size(False, "large", service)
+
+    assert size == ProjectTier.large
+    assert code_structure is None
+    service.get_code_overview.assert_not_called()
+
+
+def test_create_computes_code_overview_once(mock_settings):
+    """Test scope create calls get_code_overview once with or without a project size."""
+    from dope.cli import scope
+
+    for project_size in (None, "small"):
+        service = MagicMock()
+        service.get_code_overview.return_value = "tree"
+        service.get_complexity.return_value = ProjectTier.small
+        service.suggest_structure.side_effect = lambda template, *_: template
+
+        ctx = MagicMock()
+        ctx.settings = mock_settings
+        ctx.factory.scope_service.return_value = service
+
+        with (
+            patch.object(scope, "command_context") as command_context,
+            patch.object(scope, "ProgressReporter"),
+            patch.object(scope, "_save_state"),
+            patch.object(scope, "success"),
+        ):
+            command_context.return_value.__enter__.return_value = ctx
+            scope.create(interactive=False, project_size=project_size, branch=None)
+
+        service.get_code_overview.assert_called_once()
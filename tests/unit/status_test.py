@@ -0,0 +1,43 @@
+"""Unit tests for status command helpers."""
+
+from dope.cli.status import _count_summarized, _load_state_file
+
+
+def test_count_summarized_empty_state():
+    """Test counting an empty state returns zero for both counts."""
+    assert _count_summarized({}) == (0, 0)
+
+
+def test_count_summarized_mixed_entries():
+    """Test only entries with a summary are counted as summarized."""
+    state = {
+        "a.md": {"summary": {"sections": []}},
+        "b.md": {"summary": "text"},
+        "c.md": {"hash": "abc"},
+    }
+
+    assert _count_summarized(state) == (3, 2)
+
+
+def test_count_summarized_falsy_summaries():
+    """Test falsy summary values are not counted as summarized."""
+    state = {
+        "a.md": {"summary": None},
+        "b.md": {"summary": ""},
+        "c.md": {"summary": {}},
+        "d.md": {"summary": "done"},
+    }
+
+    assert _count_summarized(state) == (4, 1)
+
+
+def test_load_state_file_missing_returns_empty(temp_dir):
+    """Test loading a non-existent state file returns an empty dict."""
+    assert _load_state_file(temp_dir / "missing.json") == {}
+
+
+def test_load_state_file_reads_json(state_file):
+    """Test loading an existing state file returns its content."""
+    path = state_file("state.json", {"a.md": {"summary": "x"}})
+
+    assert _load_state_file(path) == {"a.md": {"summary": "x"}}
@@ -6,6 +6,7 @@ from unittest.mock import MagicMock, Mock, patch
 import pytest
 
 from dope.consumers.base import BaseConsumer
+from dope.consumers.git_consumer import DiffStat
 from dope.core.classification import FileClassification, FileClassifier
 from dope.core.usage import UsageTracker
 from dope.services.describer.strategies import (
@@ -123,11 +124,8 @@ class TestCodeScanStrategy:
 
         mock_classifier.classify.side_effect = classify_side_effect
 
-        # Mock git operations for api.py
-        mock_git_consumer.repo.git.diff.side_effect = [
-            "50\t20\tapi.py",  # numstat
-            "",  # summary
-        ]
+        # Batched diff stats for api.py
+        mock_git_consumer.get_diff_stats.return_value = {"api.py": DiffStat(50, 20)}
         mock_git_consumer.get_normalized_diff.return_value = b"meaningful diff"
         mock_git_consumer.get_content.return_value = b"file content"
 
@@ -137,6 +135,26 @@ class TestCodeScanStrategy:
         assert result["test_api.py"]["skipped"] is True
         assert result["api.py"]["hash"] is not None
         assert "skipped" not in result["api.py"]
+        assert result["api.py"]["metadata"]["lines_added"] == 50
+        mock_git_consumer.get_diff_stats.assert_called_once()
+        mock_git_consumer.repo.git.diff.assert_not_called()
+
+    def test_scan_files_skips_pure_renames_from_batched_stats(
+        self, strategy, mock_git_consumer, mock_classifier
+    ):
+        """Test renames reported by the batched diff are skipped as pure renames."""
+        mock_git_consumer.discover_files.return_value = [Path("pkg/moved.py")]
+        mock_classifier.classify.return_value = FileClassification(
+            classification="NORMAL", reason="Regular file"
+        )
+        mock_git_consumer.get_diff_stats.return_value = {
+            "pkg/moved.py": DiffStat(1, 0, rename_similarity=98)
+        }
+
+        result = strategy.scan_files(mock_git_consumer)
+
+        assert result["pkg/moved.py"]["skipped"] is True
+        assert "rename" in result["pkg/moved.py"]["skip_reason"].lower()
 
     def test_scan_files_without_filtering(self, mock_git_consumer, mock_classifier):
         """Test scan_files processes all files when filtering disabled."""
@@ -0,0 +1,25 @@
+"""Unit tests for interactive CLI prompts."""
+
+from types import SimpleNamespace
+
+import questionary
+
+from dope.cli.ui.prompts import prompt_exclude_folders
+
+
+def test_prompt_exclude_folders_lists_dirs_and_prechecks_excluded(tmp_path, monkeypatch):
+    """Test only directories are offered and hidden/default-excluded ones are checked."""
+    (tmp_path / "guides").mkdir()
+    (tmp_path / ".cache").mkdir()
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "README.md").write_text("# readme")
+    captured = {}
+
+    def fake_checkbox(message, choices):
+        captured["choices"] = {choice.value: choice.checked for choice in choices}
+        return SimpleNamespace(ask=lambda: ["node_modules"])
+
+    monkeypatch.setattr(questionary, "checkbox", fake_checkbox)
+
+    assert prompt_exclude_folders(tmp_path) == {"node_modules"}
+    assert captured["choices"] == {"guides": False, ".cache": True, "node_modules": True}